@@ -0,0 +1,92 @@
+"""
+벤치마크에서 사용하는 가짜 38커뮤니케이션 / DART 페이지와 로컬 HTTP 서버
+"""
+
+import hashlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+COMPANIES = ["에이치디현대", "LG에너지솔루션", "카카오뱅크", "SK바이오사이언스", "크래프톤", "하이브", "쏘카", "더본코리아"]
+
+
+def ipo_listing_page(n_rows: int = 60, n_filler_tables: int = 40) -> bytes:
+    """
+    레이아웃용 테이블 사이에 공모주 목록 테이블이 하나 있는 페이지를 만듭니다.
+    """
+    parts = ['<html><head><meta charset="utf-8"><title>공모주 청약일정</title></head><body>']
+    for i in range(n_filler_tables):
+        parts.append(f'<table class="menu"><tr><td><a href="/m{i}">메뉴 {i}</a></td><td>광고</td><td>{"x" * 80}</td></tr></table>')
+    parts.append('<table summary="공모주 청약일정"><tr><th>기업명</th><th>공모주일정</th><th>확정공모가</th><th>희망공모가</th><th>청약경쟁률</th><th>주간사</th></tr>')
+    for i in range(n_rows):
+        name = f"{COMPANIES[i % len(COMPANIES)]}{i}"
+        parts.append(
+            f'<tr><td><a href="/c/{i}">{name}</a></td><td>2025.10.{i % 28 + 1:02d}~10.{i % 28 + 2:02d}</td>'
+            f'<td>{10000 + i * 100:,}</td><td>9,000~12,000</td><td>{i * 3.7:.2f}:1</td><td>공모주 주간사{i % 5}</td></tr>'
+        )
+    parts.append('</table>')
+    for i in range(n_filler_tables):
+        parts.append(f'<table class="footer"><tr><td>{"y" * 120}</td><td>{i}</td><td>링크</td></tr></table>')
+    parts.append('</body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+def dart_search_page(company_name: str = "카카오뱅크", n_rows: int = 30) -> bytes:
+    """
+    DART 공시서류검색 결과와 같은 tb_list 테이블이 있는 페이지를 만듭니다.
+    """
+    parts = ['<html><head><meta charset="utf-8"></head><body>']
+    parts.append(''.join(f'<div class="nav"><ul><li>메뉴 {i}</li></ul></div>' for i in range(200)))
+    parts.append('<table class="tb_list"><tr><th>번호</th><th>회사명</th><th>보고서명</th><th>제출인</th><th>접수일자</th></tr>')
+    for i in range(n_rows):
+        parts.append(
+            f'<tr><td>{i + 1}</td><td>{company_name}</td><td>증권신고서(지분증권) {i}</td>'
+            f'<td>{company_name}</td><td>2025.{i % 12 + 1:02d}.{i % 28 + 1:02d}</td></tr>'
+        )
+    parts.append('</table></body></html>')
+    return ''.join(parts).encode('utf-8')
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 허용
+
+    def do_GET(self):
+        with self.server.hits_lock:
+            self.server.hits += 1
+        time.sleep(self.server.latency)
+        body = self.server.dart_page if self.path.startswith("/dart") else self.server.ipo_page
+        etag = f'"{hashlib.md5(body).hexdigest()}"'
+        if self.server.etags and self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        if self.server.etags:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(latency: float = 0.02, etags: bool = False) -> tuple[ThreadingHTTPServer, str]:
+    """
+    fixture 페이지를 응답하는 로컬 서버를 백그라운드 스레드에서 띄우고 base URL 을 반환합니다.
+    etags=True 이면 ETag 를 보내고 If-None-Match 가 맞으면 304 로 응답합니다.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    server.latency = latency
+    server.etags = etags
+    server.hits = 0  # 받은 요청 수
+    server.hits_lock = threading.Lock()
+    server.ipo_page = ipo_listing_page()
+    server.dart_page = dart_search_page()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+    return server, f"http://{host}:{port}"
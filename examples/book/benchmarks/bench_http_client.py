@@ -0,0 +1,87 @@
+"""
+기존 requests.get 경로와 공유 httpx.AsyncClient(ipo_http.HTTPClient) 경로의
+처리량과 p99 지연시간을 로컬 HTTP 서버를 대상으로 비교합니다.
+
+    python benchmarks/bench_http_client.py --requests 400 --concurrency 16 --latency 0.02
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _fixtures import start_server
+from ipo_http import USER_AGENT, HTTPClient
+
+
+def report(label: str, latencies: list[float], elapsed: float) -> None:
+    latencies = sorted(latencies)
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(f"{label:<28} {len(latencies) / elapsed:>9.1f} req/s   p50 {p50 * 1000:>7.2f} ms   p99 {p99 * 1000:>7.2f} ms")
+
+
+def timed_requests_get(url: str) -> float:
+    start = time.perf_counter()
+    response = requests.get(url, headers={'User-Agent': USER_AGENT})
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def bench_requests_sequential(url: str, n: int) -> None:
+    # FastMCP 는 동기 도구를 이벤트 루프에서 바로 실행하므로 호출이 하나씩 처리됩니다.
+    start = time.perf_counter()
+    latencies = [timed_requests_get(url) for _ in range(n)]
+    report("requests (sequential)", latencies, time.perf_counter() - start)
+
+
+def bench_requests_threads(url: str, n: int, concurrency: int) -> None:
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        latencies = list(pool.map(timed_requests_get, [url] * n))
+    report(f"requests (threads={concurrency})", latencies, time.perf_counter() - start)
+
+
+async def bench_httpx(url: str, n: int, concurrency: int) -> None:
+    client = HTTPClient(max_connections=concurrency, max_connections_per_host=concurrency)
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one() -> float:
+        async with gate:
+            start = time.perf_counter()
+            await client.get(url)
+            return time.perf_counter() - start
+
+    await client.get(url)  # 연결 풀 예열
+    start = time.perf_counter()
+    latencies = await asyncio.gather(*(one() for _ in range(n)))
+    report(f"httpx pooled (tasks={concurrency})", latencies, time.perf_counter() - start)
+    await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.02, help="서버 응답 지연(초)")
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency=args.latency)
+    url = f"{base_url}/html/fund/index.htm"
+    try:
+        bench_requests_sequential(url, args.requests)
+        bench_requests_threads(url, args.requests, args.concurrency)
+        asyncio.run(bench_httpx(url, args.requests, args.concurrency))
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+ipo_index.IPOSearchIndex 의 구축 시간과 검색 지연시간을 측정합니다.
+
+    python benchmarks/bench_index.py --rows 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _fixtures import COMPANIES
+from ipo_index import IPOSearchIndex
+
+
+def make_rows(n: int) -> list[list[str]]:
+    return [
+        [f"{COMPANIES[i % len(COMPANIES)]}{i}", f"2025.{i % 12 + 1:02d}.{i % 28 + 1:02d}", f"{10000 + i:,}", "9,000~12,000", f"주간사{i % 17}"]
+        for i in range(n)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--queries", type=int, default=2000)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    start = time.perf_counter()
+    index = IPOSearchIndex(rows)
+    print(f"build {len(index)} rows: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    random.seed(0)
+    queries = [
+        random.choice(["카카오 뱅크", "LG 에너지솔루션", "lg에너지", "크래프톤12", "하이브", "SK바이오"])
+        + str(random.randrange(args.rows) if random.random() < 0.5 else "")
+        for _ in range(args.queries)
+    ]
+    for label, search in [
+        ("linear scan", lambda q: [r for r in rows if q.lower() in ' '.join(r).lower()]),
+        ("IPOSearchIndex", index.search),
+    ]:
+        start = time.perf_counter()
+        for q in queries:
+            search(q)
+        per_query = (time.perf_counter() - start) / len(queries)
+        print(f"{label:<16} {per_query * 1e6:>9.1f} us/query")
+
+
+if __name__ == "__main__":
+    main()
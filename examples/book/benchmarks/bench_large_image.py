@@ -0,0 +1,94 @@
+"""
+큰 이미지(기본 12000x10000, 120MP)의 썸네일을 만들 때 최대 메모리를 비교합니다.
+
+- full decode : Image.open() + thumbnail() (이전 create_thumbnail 방식)
+- bounded     : decode_thumbnail(max_decode_bytes=--ceiling-mb)
+
+각 측정은 새 프로세스에서 실행하고 최대 RSS(ru_maxrss)와 tracemalloc 최대치를 출력합니다.
+Pillow 의 픽셀 버퍼는 C 에서 할당되어 tracemalloc 에는 잡히지 않으므로 RSS 를 기준으로 봅니다.
+합성 BMP 는 한 줄씩 써서 만들므로 생성 과정도 메모리를 거의 쓰지 않습니다.
+
+    python benchmarks/bench_large_image.py --width 12000 --height 10000 --ceiling-mb 64
+"""
+
+import argparse
+import json
+import os
+import struct
+import subprocess
+import sys
+import tempfile
+
+BOOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE = r"""
+import json, resource, sys, time, tracemalloc
+sys.path.insert(0, sys.argv[1])
+from PIL import Image
+import image_engine  # Pillow 의 픽셀 수 제한도 함께 해제됩니다.
+path, method, ceiling = sys.argv[2], sys.argv[3], int(sys.argv[4])
+tracemalloc.start()
+start = time.perf_counter()
+try:
+    if method == "full decode":
+        with Image.open(path) as img:
+            img.thumbnail((256, 256))
+            size = img.size
+    else:
+        size = image_engine.decode_thumbnail(path, (256, 256), ceiling).size
+    error = None
+except image_engine.ImageTooLargeError as e:
+    size, error = None, str(e)
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+print(json.dumps({
+    "size": size, "error": error, "elapsed": elapsed, "tracemalloc_peak": peak,
+    "max_rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024,
+}))
+"""
+
+
+def write_bmp(path: str, width: int, height: int) -> None:
+    """24비트 BMP 를 한 줄씩 써서 만듭니다."""
+    stride = (width * 3 + 3) & ~3
+    with open(path, 'wb') as f:
+        f.write(b'BM' + struct.pack('<IHHI', 54 + stride * height, 0, 0, 54))
+        f.write(struct.pack('<IiiHHIIiiII', 40, width, height, 1, 24, 0, stride * height, 2835, 2835, 0, 0))
+        row = bytearray(stride)
+        # 가로 방향(G)과 세로 방향(B)으로 밝기가 바뀌는 그라데이션
+        row[1:width * 3:3] = bytes(x * 255 // width for x in range(width))
+        for y in range(height):
+            row[0:width * 3:3] = bytes([y * 255 // height]) * width
+            f.write(row)
+
+
+def measure(path: str, method: str, ceiling: int) -> dict:
+    output = subprocess.check_output([sys.executable, "-c", MEASURE, BOOK_DIR, path, method, str(ceiling)])
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--width", type=int, default=12000)
+    parser.add_argument("--height", type=int, default=10000)
+    parser.add_argument("--ceiling-mb", type=int, default=64)
+    args = parser.parse_args()
+    ceiling = args.ceiling_mb * 1024 * 1024
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        path = os.path.join(work_dir, "large.bmp")
+        write_bmp(path, args.width, args.height)
+        megapixels = args.width * args.height / 1e6
+        print(f"{args.width}x{args.height} ({megapixels:.0f} MP) BMP, {os.path.getsize(path) / 1024 / 1024:.0f} MB, ceiling {args.ceiling_mb} MB")
+        for method in ("full decode", "bounded"):
+            result = measure(path, method, ceiling)
+            outcome = result["error"] or f"-> {result['size'][0]}x{result['size'][1]}"
+            print(
+                f"{method:<12} max RSS {result['max_rss'] / 1024 / 1024:>8.1f} MB   "
+                f"tracemalloc {result['tracemalloc_peak'] / 1024 / 1024:>6.1f} MB   "
+                f"{result['elapsed'] * 1000:>8.1f} ms   {outcome}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+tutorial_5 의 greeting 리소스를 읽는 비용을 비교합니다.
+
+- read_resource : FastMCP.read_resource() (ctx.read_resource() 가 호출하는 경로)
+- local         : LocalResources.read() 에서 URI 마다 처음 읽는 경우 (템플릿 대조 + 핸들러 호출)
+- local (memo)  : LocalResources.read() 에서 기억해 둔 결과를 돌려주는 경우
+
+tutorial_5 는 DEBUG 로그를 stderr 로 출력하므로, 로그 비용을 빼고 비교하도록 WARNING 으로 올립니다.
+
+    python benchmarks/bench_local_resources.py --calls 20000
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import sys
+import time
+
+BOOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BOOK_DIR)
+
+import tutorial_5
+
+logging.getLogger().setLevel(logging.WARNING)
+
+
+async def measure(label: str, read, uris: list[str]) -> None:
+    start = time.perf_counter()
+    for uri in uris:
+        await read(uri)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<14} {elapsed / len(uris) * 1e6:>9.2f} us/call   {len(uris) / elapsed:>12,.0f} calls/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=20000)
+    args = parser.parse_args()
+
+    # URI 가 모두 다르므로 local 측정에서는 기억해 둔 결과를 쓰지 않습니다.
+    uris = [f"greeting://user{i}" for i in range(args.calls)]
+    resources = tutorial_5.resources
+
+    await measure("read_resource", tutorial_5.mcp.read_resource, uris)
+    await measure("local", resources.read, uris)
+    hot = uris[-100:]
+    await measure("local (memo)", resources.read, hot * (args.calls // len(hot)))
+    print(resources.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
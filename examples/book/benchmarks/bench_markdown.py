@@ -0,0 +1,77 @@
+"""
+긴 Markdown 분석 내용을 flowable 로 변환하는 처리량(MB/s)과 PDF 전체 렌더링 처리량,
+렌더링 중 최대 메모리(tracemalloc)를 측정합니다.
+
+    python benchmarks/bench_markdown.py --mb 1 4
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+BOOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BOOK_DIR)
+
+from ipo_markdown import iter_markdown_flowables
+from ipo_report import get_template
+
+SECTION = """## 1. 기업 분석
+
+매출과 영업이익이 3년 연속 증가했고 **부채비율**은 업계 평균보다 낮습니다.
+공모가 밴드 상단 기준 PER 은 *동종 업계 평균* 대비 10% 할인된 수준입니다.
+
+### 주요 지표
+
+| 항목 | 2022 | 2023 |
+|------|------|------|
+| 매출 | 1,200억 | 1,450억 |
+| 영업이익 | 90억 | 130억 |
+
+- 기관 수요예측 경쟁률 1,200:1
+- 의무보유 확약 비율 35%
+1. 상장일 유통 가능 물량 25%
+2. 보호예수 해제 일정 확인 필요
+
+"""
+
+
+def make_content(megabytes: float) -> str:
+    size = len(SECTION.encode('utf-8'))
+    return SECTION * max(1, int(megabytes * 1024 * 1024 / size))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mb", type=float, nargs="+", default=[1.0])
+    args = parser.parse_args()
+
+    template = get_template()
+    with tempfile.TemporaryDirectory() as out_dir:
+        for megabytes in args.mb:
+            content = make_content(megabytes)
+            size_mb = len(content.encode('utf-8')) / 1024 / 1024
+
+            start = time.perf_counter()
+            count = sum(1 for _ in iter_markdown_flowables(content, template, 450))
+            convert = time.perf_counter() - start
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            template.build("카카오뱅크", content, os.path.join(out_dir, "report.pdf"))
+            render = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(
+                f"{size_mb:>6.2f} MB  {count:>8} flowables  "
+                f"convert {size_mb / convert:>7.2f} MB/s  "
+                f"render {size_mb / render:>6.3f} MB/s ({render:.1f} s)  "
+                f"peak {peak / 1024 / 1024:>7.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+전체 html.parser 트리를 만드는 기존 파서와 ipo_parser 의 테이블 한정 파서를
+파싱 시간과 tracemalloc 최대 메모리로 비교합니다.
+
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --ipo-page saved_38.html --dart-page saved_dart.html
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _fixtures import dart_search_page, ipo_listing_page
+from ipo_parser import iter_ipo_rows, iter_reports
+
+
+def legacy_ipo_rows(content: bytes) -> list[list[str]]:
+    soup = BeautifulSoup(content, 'html.parser')
+    ipo_data = []
+    for table in soup.find_all('table'):
+        for row in table.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) >= 3:
+                row_data = [cell.get_text(strip=True) for cell in cells]
+                if any(keyword in ' '.join(row_data).lower() for keyword in ['기업명', '공모가', '상장일', '공모주']):
+                    ipo_data.append(row_data)
+    return ipo_data
+
+
+def legacy_reports(content: bytes) -> list[dict[str, str]]:
+    soup = BeautifulSoup(content, 'html.parser')
+    result_table = soup.find('table', {'class': 'tb_list'})
+    reports = []
+    for row in result_table.find_all('tr')[1:][:10]:
+        cells = row.find_all(['td', 'th'])
+        if len(cells) >= 5:
+            reports.append({
+                'company': cells[1].get_text(strip=True),
+                'report_name': cells[2].get_text(strip=True),
+                'submitter': cells[3].get_text(strip=True),
+                'date': cells[4].get_text(strip=True),
+            })
+    return reports
+
+
+def measure(label: str, parse, content: bytes, repeat: int) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        rows = parse(content)
+    elapsed = (time.perf_counter() - start) / repeat
+
+    tracemalloc.start()
+    parse(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {elapsed * 1000:>8.2f} ms/page   peak {peak / 1024:>9.1f} KiB   rows {len(rows)}")
+
+
+def read_page(path: str, default: bytes) -> bytes:
+    if not path:
+        return default
+    with open(path, 'rb') as f:
+        return f.read()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ipo-page", default="", help="저장해 둔 38커뮤니케이션 페이지 (없으면 생성한 fixture)")
+    parser.add_argument("--dart-page", default="", help="저장해 둔 DART 검색 결과 페이지 (없으면 생성한 fixture)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    ipo_page = read_page(args.ipo_page, ipo_listing_page())
+    dart_page = read_page(args.dart_page, dart_search_page())
+
+    # 열 제목 행이 공모주 행으로 섞여 스냅샷 저장소에 들어가면 안 됩니다.
+    header_rows = [row for row in iter_ipo_rows(ipo_page) if row[0] == '기업명']
+    assert not header_rows, f"header row parsed as an IPO row: {header_rows[0]}"
+
+    print(f"38 page: {len(ipo_page) / 1024:.1f} KiB")
+    measure("legacy ipo", legacy_ipo_rows, ipo_page, args.repeat)
+    measure("ipo_parser ipo", lambda c: list(iter_ipo_rows(c)), ipo_page, args.repeat)
+    print(f"DART page: {len(dart_page) / 1024:.1f} KiB")
+    measure("legacy dart", legacy_reports, dart_page, args.repeat)
+    measure("ipo_parser dart", lambda c: list(iter_reports(c)), dart_page, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+generate_ipo_report 의 PDF 렌더링 처리량(reports/s)을 워커 수별로 측정합니다.
+
+    python benchmarks/bench_report_pool.py --reports 32 --paragraphs 200
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ipo_report import ReportRenderer, render_report
+
+
+def analysis_content(paragraphs: int) -> str:
+    blocks = []
+    for i in range(paragraphs):
+        if i % 10 == 0:
+            blocks.append(f"**{i // 10 + 1}. 섹션 제목**")
+        blocks.append("공모가 밴드 상단 확정 가능성이 높으며 기관 수요예측 경쟁률이 양호합니다. " * 4)
+    return "\n\n".join(blocks)
+
+
+async def bench_pool(workers: int, n: int, content: str, out_dir: str) -> float:
+    renderer = ReportRenderer(max_workers=workers, max_pending=n + workers)
+    # 워커 프로세스를 띄우고 모듈을 불러오는 시간은 측정에서 뺍니다.
+    await asyncio.gather(*(renderer.render("워밍업", "x", os.path.join(out_dir, f"warm{i}.pdf")) for i in range(workers)))
+    start = time.perf_counter()
+    await asyncio.gather(*(renderer.render("카카오뱅크", content, os.path.join(out_dir, f"{workers}_{i}.pdf")) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    renderer.shutdown()
+    return n / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reports", type=int, default=32)
+    parser.add_argument("--paragraphs", type=int, default=200)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    content = analysis_content(args.paragraphs)
+    with tempfile.TemporaryDirectory() as out_dir:
+        start = time.perf_counter()
+        for i in range(args.reports):
+            render_report("카카오뱅크", content, os.path.join(out_dir, f"inline_{i}.pdf"))
+        print(f"{'in-process (before)':<22} {args.reports / (time.perf_counter() - start):>7.2f} reports/s")
+
+        workers = 1
+        while workers <= args.max_workers:
+            rate = asyncio.run(bench_pool(workers, args.reports, content, out_dir))
+            print(f"{f'process pool x{workers}':<22} {rate:>7.2f} reports/s")
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+보고서 한 건의 렌더링 지연시간을 cold(매번 ReportTemplate 생성) / warm(템플릿 재사용)으로 비교합니다.
+첫 보고서 지연시간은 새 프로세스에서 측정합니다.
+
+    python benchmarks/bench_report_template.py --reports 20
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BOOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BOOK_DIR)
+
+import ipo_report
+from ipo_report import ReportTemplate, render_report
+
+CONTENT = "\n\n".join(
+    ["**1. 기업 분석**"] + ["매출과 영업이익이 3년 연속 증가했고 부채비율은 업계 평균보다 낮습니다. " * 3] * 12
+)
+
+
+def first_report_in_new_process(out_dir: str) -> float:
+    code = (
+        "import sys, time; sys.path.insert(0, sys.argv[1]);"
+        "start = time.perf_counter();"
+        "from ipo_report import render_report;"
+        "render_report('카카오뱅크', sys.argv[2], sys.argv[3]);"
+        "print(time.perf_counter() - start)"
+    )
+    output = subprocess.check_output(
+        [sys.executable, "-c", code, BOOK_DIR, CONTENT, os.path.join(out_dir, "first.pdf")]
+    )
+    return float(output)
+
+
+def measure(label: str, render, n: int, out_dir: str) -> None:
+    latencies = []
+    for i in range(n):
+        start = time.perf_counter()
+        render(os.path.join(out_dir, f"{label}_{i}.pdf"))
+        latencies.append(time.perf_counter() - start)
+    print(f"{label:<28} p50 {statistics.median(latencies) * 1000:>8.2f} ms   max {max(latencies) * 1000:>8.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reports", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as out_dir:
+        print(f"{'first report (new process)':<28} {first_report_in_new_process(out_dir) * 1000:>12.2f} ms")
+        measure("cold (template per report)", lambda path: ReportTemplate().build("카카오뱅크", CONTENT, path), args.reports, out_dir)
+        ipo_report.get_template()
+        measure("warm (cached template)", lambda path: render_report("카카오뱅크", CONTENT, path), args.reports, out_dir)
+
+
+if __name__ == "__main__":
+    main()
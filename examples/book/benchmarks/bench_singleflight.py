@@ -0,0 +1,59 @@
+"""
+같은 인자로 동시에 들어온 get_ipo_data / get_securities_report 호출이
+upstream 요청 한 번으로 합쳐지는지 확인합니다.
+
+    python benchmarks/bench_singleflight.py --callers 100
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from _fixtures import start_server
+
+# 다른 실행이 남긴 캐시/스냅샷을 쓰지 않도록 임시 경로를 사용합니다.
+_tmp = tempfile.mkdtemp()
+os.environ["IPO_STORE_PATH"] = os.path.join(_tmp, "snapshots.sqlite3")
+os.environ["IPO_SHARED_CACHE_PATH"] = os.path.join(_tmp, "shared_cache.sqlite3")
+
+import practice
+
+
+async def burst(label: str, server, call, n: int) -> None:
+    before = server.hits
+    start = time.perf_counter()
+    results = await asyncio.gather(*(call(i) for i in range(n)))
+    elapsed = time.perf_counter() - start
+    fetches = server.hits - before
+    print(f"{label:<38} {n} calls -> {fetches} upstream fetch(es) in {elapsed * 1000:.1f} ms")
+    assert fetches == 1, f"expected exactly one upstream fetch, got {fetches}"
+    assert len(set(results)) == 1
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--callers", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    server, base_url = start_server(latency=args.latency)
+    practice.IPO_URL = f"{base_url}/ipo"
+    practice.DART_SEARCH_URL = f"{base_url}/dart"
+
+    async def run() -> None:
+        await burst("get_ipo_data('카카오')", server, lambda i: practice.get_ipo_data("카카오"), args.callers)
+        await burst("get_securities_report('카카오뱅크')", server,
+                    lambda i: practice.get_securities_report("카카오뱅크"), args.callers)
+        await practice.http_client.aclose()
+
+    asyncio.run(run())
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+sample-image.jpg 썸네일 생성 지연시간을 비교합니다.
+
+- full decode     : 원본 해상도 전체를 디코딩한 뒤 줄이기
+- before          : 이전 create_thumbnail (Image.thumbnail 기본값 + 임시 PNG 파일)
+- draft decode    : ThumbnailEngine 의 DCT 축소 디코딩 + PNG 인코딩 (캐시 없음)
+- cached          : ThumbnailEngine.thumbnail() 반복 호출 (캐시 적중)
+
+    python benchmarks/bench_thumbnail.py --runs 10
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BOOK_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BOOK_DIR)
+
+from PIL import Image
+
+from image_engine import ThumbnailEngine, decode_thumbnail, encode_image
+
+SIZE = (100, 100)
+
+
+def full_decode(path: str) -> bytes:
+    with Image.open(path) as img:
+        img.load()
+        thumb = img.resize(SIZE, Image.Resampling.LANCZOS, reducing_gap=None)
+    return encode_image(thumb, 'png')
+
+
+def before(path: str) -> bytes:
+    img = Image.open(path)
+    img.thumbnail(SIZE)
+    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
+        img.save(tmp, format="png")
+        tmp_path = tmp.name
+    with open(tmp_path, 'rb') as f:
+        data = f.read()
+    os.unlink(tmp_path)
+    return data
+
+
+def draft_decode(path: str) -> bytes:
+    return encode_image(decode_thumbnail(path, SIZE), 'png')
+
+
+def measure(label: str, fn, path: str, runs: int) -> None:
+    latencies = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn(path)
+        latencies.append(time.perf_counter() - start)
+    print(f"{label:<14} p50 {statistics.median(latencies) * 1000:>9.2f} ms   max {max(latencies) * 1000:>9.2f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image", default=os.path.join(BOOK_DIR, "..", "..", "sample-image.jpg"))
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    with Image.open(args.image) as img:
+        print(f"{args.image}: {img.size[0]}x{img.size[1]} {img.mode}, {os.path.getsize(args.image) / 1024 / 1024:.1f} MB")
+
+    measure("full decode", full_decode, args.image, max(1, args.runs // 3))
+    measure("before", before, args.image, args.runs)
+    measure("draft decode", draft_decode, args.image, args.runs)
+    engine = ThumbnailEngine()
+    measure("cached", lambda path: engine.thumbnail(path, SIZE), args.image, args.runs * 100)
+    print(engine.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+"""
+tutorial_4.py 에서 사용하는 썸네일 엔진과 일괄 처리기
+
+- JPEG 은 draft() 로 DCT 단계에서 1/2, 1/4, 1/8 로 줄여 디코딩하므로
+  원본 해상도(예: 9504x6336) 전체를 메모리에 풀지 않습니다.
+- 인코딩한 썸네일은 (경로, 수정 시각, 파일 크기, 썸네일 크기, 포맷) 을 키로 LRU 캐시에 보관하고
+  임시 파일 없이 bytes 로 반환합니다. 원본 파일이 바뀌면 키가 달라지므로 새로 만듭니다.
+- 디코딩에 필요한 메모리가 max_decode_bytes 를 넘는 이미지는 무압축(raw) 형식(BMP, PPM, 무압축 TIFF)이면
+  몇 줄씩(band) 나눠 읽어 Image.reduce() 로 줄이고, 그 밖의 형식이면 ImageTooLargeError 를 발생시킵니다.
+- ImageBatchProcessor 는 디렉터리/glob 의 이미지들을 프로세스 풀에서 여러 크기로 변환합니다.
+"""
+
+import asyncio
+import glob
+import io
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Iterator, Optional
+
+from PIL import Image, ImageOps
+
+# 픽셀 수 대신 디코딩 메모리(max_decode_bytes)로 직접 제한하므로 Pillow 의 픽셀 수 경고/제한은 끕니다.
+Image.MAX_IMAGE_PIXELS = None
+
+DEFAULT_MAX_DECODE_BYTES = 256 * 1024 * 1024
+
+# PNG/WebP 로 바로 저장할 수 없는 모드(CMYK, YCbCr 등)는 RGB 로 바꿉니다.
+_SAVEABLE_MODES = {'1', 'L', 'LA', 'P', 'RGB', 'RGBA'}
+
+IMAGE_EXTENSIONS = {'.jpg', '.jpeg', '.png', '.webp', '.gif', '.bmp', '.tif', '.tiff'}
+# 출력 포맷 이름 -> (Pillow 포맷, 확장자)
+OUTPUT_FORMATS = {'png': ('PNG', 'png'), 'jpeg': ('JPEG', 'jpg'), 'jpg': ('JPEG', 'jpg'), 'webp': ('WEBP', 'webp')}
+
+
+class ImageTooLargeError(Exception):
+    pass
+
+
+# Pillow 가 한 픽셀에 쓰는 메모리 (RGB 도 내부적으로 4바이트를 씁니다)
+_BYTES_PER_PIXEL = {'1': 1, 'L': 1, 'P': 1, 'I;16': 2, 'I;16B': 2, 'I;16L': 2, 'I;16N': 2}
+
+# stride 가 0 으로 주어진 raw 타일의 한 줄 길이를 계산하기 위한 rawmode 별 비트 수
+_RAW_BITS = {
+    '1': 1, 'L': 8, 'P': 8, 'LA': 16, 'RGB': 24, 'BGR': 24, 'RGBA': 32, 'RGBX': 32, 'BGRA': 32,
+    'BGRX': 32, 'CMYK': 32, 'I;16': 16, 'I;16B': 16, 'I;16L': 16,
+}
+
+
+def decoded_bytes(mode: str, size: tuple[int, int]) -> int:
+    return size[0] * size[1] * _BYTES_PER_PIXEL.get(mode, 4)
+
+
+def decode_thumbnail(path: str, size: tuple[int, int], max_decode_bytes: int = DEFAULT_MAX_DECODE_BYTES) -> Image.Image:
+    """
+    path 의 이미지를 size 안에 들어가도록 줄여서 반환합니다. (비율 유지)
+    JPEG 은 size 보다 작아지지 않는 가장 큰 DCT 축소 배율로 디코딩합니다.
+    디코딩에 max_decode_bytes 보다 많은 메모리가 필요하면 band 단위로 읽거나 ImageTooLargeError 를 발생시킵니다.
+    """
+    with Image.open(path) as img:
+        if img.format == 'JPEG':
+            img.draft('RGB', size)
+        if decoded_bytes(img.mode, img.size) <= max_decode_bytes:
+            img.thumbnail(size, Image.Resampling.LANCZOS)
+            # 세로로 찍은 사진도 올바른 방향으로 보이도록 EXIF 회전 정보를 적용합니다.
+            thumb = ImageOps.exif_transpose(img)
+        else:
+            thumb = _reduce_in_bands(path, img, size, max_decode_bytes)
+            thumb.thumbnail(size, Image.Resampling.LANCZOS)
+    if thumb.mode not in _SAVEABLE_MODES:
+        thumb = thumb.convert('RGB')
+    return thumb
+
+
+def _raw_tiles(img: Image.Image) -> Optional[list[tuple]]:
+    """모든 타일이 raw 디코더이면 (box, offset, rawmode, stride, orientation) 목록을, 아니면 None 을 반환합니다."""
+    tiles = []
+    for decoder_name, box, offset, args in img.tile:
+        if decoder_name != 'raw':
+            return None
+        if isinstance(args, str):
+            args = (args, 0, 1)
+        rawmode, stride, orientation = (tuple(args) + (0, 1))[:3]
+        if not stride:
+            if rawmode not in _RAW_BITS:
+                return None
+            stride = ((box[2] - box[0]) * _RAW_BITS[rawmode] + 7) // 8
+        tiles.append((box, offset, rawmode, stride, orientation))
+    return tiles or None
+
+
+def _band_tiles(tiles: list[tuple], top: int, bottom: int) -> list[tuple]:
+    """top~bottom 줄만 읽도록 각 타일의 영역과 파일 위치를 잘라낸 타일 목록을 만듭니다."""
+    band = []
+    for (x0, y0, x1, y1), offset, rawmode, stride, orientation in tiles:
+        start, end = max(y0, top), min(y1, bottom)
+        if start >= end:
+            continue
+        # orientation 이 -1 이면 (BMP 등) 아래쪽 줄부터 저장되어 있습니다.
+        skip = start - y0 if orientation > 0 else y1 - end
+        band.append(('raw', (x0, start - top, x1, end - top), offset + skip * stride, (rawmode, stride, orientation)))
+    return band
+
+
+def _reducible(img: Image.Image) -> Image.Image:
+    """Image.reduce() 가 지원하지 않는 모드는 가까운 모드로 바꿉니다."""
+    if img.mode == 'P':
+        return img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+    if img.mode == '1':
+        return img.convert('L')
+    if img.mode.startswith('I;16'):
+        return img.convert('I')
+    return img
+
+
+def _reduce_in_bands(path: str, img: Image.Image, size: tuple[int, int], max_decode_bytes: int) -> Image.Image:
+    """
+    무압축 이미지를 band 단위로 읽어 정수배로 줄인 뒤 이어 붙입니다.
+    한 번에 메모리에 올리는 band 는 max_decode_bytes 의 절반을 넘지 않습니다.
+    """
+    tiles = _raw_tiles(img)
+    width, height = img.size
+    if tiles is None:
+        raise ImageTooLargeError(
+            f"{width}x{height} {img.format} 이미지는 디코딩에 "
+            f"{decoded_bytes(img.mode, img.size) / 1024 / 1024:.0f} MB 가 필요해 "
+            f"제한({max_decode_bytes / 1024 / 1024:.0f} MB)을 넘습니다."
+        )
+
+    factor = max(1, min(width // size[0], height // size[1]))
+    row_bytes = decoded_bytes(img.mode, (width, 1))
+    rows = (max_decode_bytes // 2 // row_bytes) // factor * factor
+    if rows < factor:
+        raise ImageTooLargeError(f"{width}x{height} 이미지는 한 줄이 너무 길어 나눠 읽을 수 없습니다.")
+
+    reduced: Optional[Image.Image] = None
+    for top in range(0, height, rows):
+        bottom = min(top + rows, height)
+        with Image.open(path) as band:
+            band.tile = _band_tiles(tiles, top, bottom)
+            band._size = (width, bottom - top)
+            band.load()
+            small = _reducible(band).reduce(factor)
+        if reduced is None:
+            reduced = Image.new(small.mode, (-(-width // factor), -(-height // factor)))
+        reduced.paste(small, (0, top // factor))
+    return reduced
+
+
+def encode_image(img: Image.Image, format: str) -> bytes:
+    buffer = io.BytesIO()
+    if format.upper() in ('JPEG', 'JPG') and img.mode not in ('L', 'RGB'):
+        img = img.convert('RGB')
+    img.save(buffer, format=format)
+    return buffer.getvalue()
+
+
+class ThumbnailEngine:
+    """
+    썸네일을 만들고 인코딩된 결과를 LRU 캐시에 보관합니다.
+
+    캐시는 항목 수 max_entries, 합계 max_bytes 를 넘으면 가장 오래 쓰지 않은 것부터 버립니다.
+    여러 스레드에서 동시에 호출해도 됩니다.
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024, max_decode_bytes: int = DEFAULT_MAX_DECODE_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_decode_bytes = max_decode_bytes
+        self._entries: OrderedDict[tuple, bytes] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def cache_key(path: str, size: tuple[int, int], format: str) -> tuple:
+        stat = os.stat(path)
+        return (os.path.realpath(path), stat.st_mtime_ns, stat.st_size, tuple(size), format.lower())
+
+    def thumbnail(self, path: str, size: tuple[int, int] = (100, 100), format: str = 'png') -> bytes:
+        """path 의 썸네일을 format 으로 인코딩한 bytes 를 반환합니다."""
+        key = self.cache_key(path, size, format)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+            self.misses += 1
+
+        # 디코딩/인코딩은 잠금 밖에서 합니다. 같은 키를 동시에 만들면 나중 결과로 덮어씁니다.
+        data = encode_image(decode_thumbnail(path, size, self.max_decode_bytes), format)
+        self._store(key, data)
+        return data
+
+    def _store(self, key: tuple, data: bytes) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= len(previous)
+            self._entries[key] = data
+            self._bytes += len(data)
+            while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def iter_image_paths(source: str) -> Iterator[str]:
+    """source 가 디렉터리면 그 안의 이미지 파일을, 아니면 glob 패턴(** 포함)에 맞는 이미지 파일을 내보냅니다."""
+    if os.path.isdir(source):
+        entries = (entry.path for entry in os.scandir(source) if entry.is_file())
+    else:
+        entries = glob.iglob(os.path.expanduser(source), recursive=True)
+    for path in sorted(entries):
+        if os.path.splitext(path)[1].lower() in IMAGE_EXTENSIONS and os.path.isfile(path):
+            yield path
+
+
+def process_image(
+    path: str,
+    sizes: list[int],
+    format: str,
+    output_dir: str,
+    stem: Optional[str] = None,
+    max_decode_bytes: int = DEFAULT_MAX_DECODE_BYTES,
+) -> dict[str, Any]:
+    """
+    path 의 이미지를 sizes 의 각 크기(긴 변 기준)로 줄여 output_dir/<stem>_<size>.<확장자> 로 저장하고 결과를 반환합니다.
+    가장 큰 크기로 한 번만 디코딩한 뒤 그 결과에서 작은 크기들을 만듭니다.
+    프로세스 풀 워커에서 실행되므로 모듈 최상위 함수로 두고, 예외 대신 error 를 담아 반환합니다.
+    """
+    start = time.perf_counter()
+    result: dict[str, Any] = {"source": path, "outputs": []}
+    try:
+        pil_format, extension = OUTPUT_FORMATS[format.lower()]
+        stem = stem or os.path.splitext(os.path.basename(path))[0]
+        largest = max(sizes)
+        img = decode_thumbnail(path, (largest, largest), max_decode_bytes)
+        for size in sorted(set(sizes), reverse=True):
+            img.thumbnail((size, size), Image.Resampling.LANCZOS)
+            output_path = os.path.join(output_dir, f"{stem}_{size}.{extension}")
+            data = encode_image(img, pil_format)
+            with open(output_path, 'wb') as f:
+                f.write(data)
+            result["outputs"].append({"size": size, "width": img.width, "height": img.height, "path": output_path, "bytes": len(data)})
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    return result
+
+
+def _unique_stems(paths: list[str]) -> Iterator[str]:
+    """다른 디렉터리의 같은 이름 파일이 서로 덮어쓰지 않도록 두 번째부터 -2, -3 ... 을 붙입니다."""
+    seen: dict[str, int] = {}
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        seen[stem] = seen.get(stem, 0) + 1
+        yield stem if seen[stem] == 1 else f"{stem}-{seen[stem]}"
+
+
+ProgressCallback = Callable[[int, int, dict[str, Any]], Awaitable[None]]
+
+
+class ImageBatchProcessor:
+    """
+    process_image 를 프로세스 풀에서 실행합니다.
+
+    파일 목록이 수천 개여도 한 번에 풀에 넣는 작업은 워커 수의 window 배까지만 두고,
+    하나가 끝날 때마다 다음 파일을 넣습니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        window: int = 4,
+        max_files: int = 10000,
+        max_decode_bytes: int = DEFAULT_MAX_DECODE_BYTES,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.window = window
+        self.max_files = max_files
+        # 워커 하나가 이미지 하나를 디코딩할 때 쓰는 메모리 상한입니다. (전체 최대치 = max_workers * max_decode_bytes)
+        self.max_decode_bytes = max_decode_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 서버 프로세스의 스레드/이벤트 루프를 fork 하지 않도록 spawn 으로 워커를 띄웁니다.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    def _submit(self, *args) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        try:
+            return loop.run_in_executor(self.executor, process_image, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되어 풀을 쓸 수 없으면 새 풀을 만들어 한 번 더 시도합니다.
+            self.shutdown()
+            return loop.run_in_executor(self.executor, process_image, *args)
+
+    async def run(
+        self,
+        paths: list[str],
+        sizes: list[int],
+        format: str,
+        output_dir: str,
+        on_progress: Optional[ProgressCallback] = None,
+    ) -> list[dict[str, Any]]:
+        """
+        paths 를 모두 처리하고 입력 순서대로 결과를 반환합니다.
+        파일 하나가 끝날 때마다 await on_progress(완료 수, 전체 수, 결과) 를 호출합니다.
+        """
+        if len(paths) > self.max_files:
+            raise ValueError(f"한 번에 처리할 수 있는 파일은 최대 {self.max_files}개입니다. ({len(paths)}개)")
+        if format.lower() not in OUTPUT_FORMATS:
+            raise ValueError(f"지원하지 않는 출력 포맷입니다: {format} (가능: {', '.join(sorted(OUTPUT_FORMATS))})")
+        if not sizes or min(sizes) <= 0:
+            raise ValueError("sizes 에는 1 이상의 크기를 하나 이상 지정해야 합니다.")
+        os.makedirs(output_dir, exist_ok=True)
+
+        results: list[Optional[dict[str, Any]]] = [None] * len(paths)
+        pending: dict[asyncio.Future, int] = {}
+        queue = zip(range(len(paths)), paths, _unique_stems(paths))
+        limit = self.max_workers * self.window
+        done_count = 0
+        try:
+            while True:
+                for index, path, stem in queue:
+                    pending[self._submit(path, sizes, format, output_dir, stem, self.max_decode_bytes)] = index
+                    if len(pending) >= limit:
+                        break
+                if not pending:
+                    break
+                finished, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in finished:
+                    index = pending.pop(future)
+                    results[index] = future.result()
+                    done_count += 1
+                    if on_progress is not None:
+                        await on_progress(done_count, len(paths), results[index])
+        finally:
+            # 호출이 취소되면 아직 시작하지 않은 작업도 취소합니다.
+            for future in pending:
+                future.cancel()
+        return results
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
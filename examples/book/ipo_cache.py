@@ -0,0 +1,115 @@
+"""
+practice.py(ipo_analyzer) 에서 사용하는 프로세스 내 TTL 캐시
+
+- TTL 이 지나지 않은 값은 그대로 반환합니다. (hit)
+- TTL 이 지났지만 값이 남아 있으면 오래된 값을 먼저 반환하고,
+  백그라운드 태스크에서 새로 고칩니다. (stale-while-revalidate)
+- 값이 없으면 호출한 쪽에서 직접 가져옵니다. (miss)
+  같은 키를 동시에 요청하면 SingleFlight 로 한 번만 가져와 결과를 나눠 받습니다.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class SingleFlight:
+    """
+    같은 key 로 동시에 들어온 호출을 하나로 합칩니다.
+
+    처음 호출한 쪽이 fn() 을 태스크로 시작하고, 그 태스크가 끝나기 전에 들어온 호출은
+    같은 태스크의 결과(또는 예외)를 함께 받습니다. 기다리던 호출 하나가 취소되어도
+    태스크는 취소되지 않습니다.
+    """
+
+    def __init__(self):
+        self._inflight: dict[Hashable, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.create_task(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "in_flight": len(self._inflight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+        }
+
+
+class TTLCache:
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: dict[Hashable, tuple[Any, float]] = {}
+        self._refreshing: dict[Hashable, asyncio.Task] = {}
+        self._flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+        self.refresh_errors = 0
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        key 에 해당하는 값을 반환합니다. 없으면 await loader() 로 가져와 저장합니다.
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            if time.monotonic() - stored_at < self.ttl:
+                self.hits += 1
+                return value
+
+            # 오래된 값은 바로 돌려주고, 새로 고침은 한 번만 시작합니다.
+            self.stale_hits += 1
+            if key not in self._refreshing:
+                self._refreshing[key] = asyncio.create_task(self._refresh(key, loader))
+            return value
+
+        self.misses += 1
+        value = await self._flight.do(key, loader)
+        self.set(key, value)
+        return value
+
+    def set(self, key: Hashable, value: Any, stale: bool = False) -> None:
+        """
+        값을 저장합니다. stale=True 이면 이미 만료된 값으로 저장하여
+        다음 조회에서 바로 반환하되 백그라운드 새로 고침이 시작되게 합니다.
+        """
+        stored_at = time.monotonic()
+        if stale:
+            stored_at -= self.ttl
+        self._entries[key] = (value, stored_at)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ttl": self.ttl,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale_hits": self.stale_hits,
+            "refresh_errors": self.refresh_errors,
+            "coalesced_misses": self._flight.coalesced,
+        }
+
+    async def _refresh(self, key: Hashable, loader: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            value = await loader()
+        except Exception:
+            # 새로 고침에 실패하면 기존 값을 유지하고 다음 요청에서 다시 시도합니다.
+            self.refresh_errors += 1
+        else:
+            self.set(key, value)
+        finally:
+            self._refreshing.pop(key, None)
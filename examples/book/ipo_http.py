@@ -0,0 +1,202 @@
+"""
+practice.py(ipo_analyzer) 의 스크래핑 도구들이 공유하는 비동기 HTTP 클라이언트
+
+- 하나의 httpx.AsyncClient 를 재사용하여 TCP/TLS 연결을 keep-alive 로 유지합니다.
+- 전체 연결 수와 keep-alive 연결 수는 httpx.Limits 로, 호스트별 동시 요청 수는
+  호스트마다 세마포어로 제한합니다.
+- 호스트별로 초당 요청 수를 제한할 수 있습니다. (rate_limit_per_host)
+- 연결/읽기 타임아웃을 명시적으로 지정합니다.
+- get_parsed() 는 URL 별로 ETag / Last-Modified 와 본문 해시를 기억해 두고
+  조건부 요청을 보냅니다. 304 응답이거나 본문이 바뀌지 않았으면 파싱을 건너뛰고
+  이전 파싱 결과를 반환합니다.
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+import httpx
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+
+
+class RateLimiter:
+    """
+    요청 시작 시각을 1/rate 초 간격으로 벌려 초당 요청 수를 제한합니다.
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+@dataclass
+class _PageValidators:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    digest: bytes
+    size: int
+    parsed: Any
+
+
+class HTTPClient:
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_connections_per_host: int = 4,
+        connect_timeout: float = 5.0,
+        read_timeout: float = 15.0,
+        keepalive_expiry: float = 30.0,
+        rate_limit_per_host: float = 0.0,
+        max_validator_entries: int = 256,
+    ):
+        self.max_connections_per_host = max_connections_per_host
+        self.rate_limit_per_host = rate_limit_per_host
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._timeout = httpx.Timeout(
+            connect=connect_timeout,
+            read=read_timeout,
+            write=read_timeout,
+            pool=connect_timeout,
+        )
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._host_rate_limiters: dict[str, RateLimiter] = {}
+        self.max_validator_entries = max_validator_entries
+        self._validators: OrderedDict[str, _PageValidators] = OrderedDict()
+        self.requests = 0
+        self.not_modified = 0
+        self.unchanged_bodies = 0
+        self.bytes_received = 0
+        self.bytes_saved = 0
+        self.parse_skipped = 0
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # 이벤트 루프 안에서 처음 사용할 때 생성합니다.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                headers={'User-Agent': USER_AGENT},
+                limits=self._limits,
+                timeout=self._timeout,
+                follow_redirects=True,
+            )
+        return self._client
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    def _host_rate_limiter(self, host: str) -> Optional[RateLimiter]:
+        if self.rate_limit_per_host <= 0:
+            return None
+        limiter = self._host_rate_limiters.get(host)
+        if limiter is None:
+            limiter = RateLimiter(self.rate_limit_per_host)
+            self._host_rate_limiters[host] = limiter
+        return limiter
+
+    async def get(
+        self,
+        url: str,
+        params: Optional[dict[str, Any]] = None,
+        headers: Optional[dict[str, str]] = None,
+    ) -> httpx.Response:
+        """
+        GET 요청을 보내고 응답을 반환합니다.
+        조건부 요청의 304 응답은 그대로 반환하고, 그 밖의 성공이 아닌 응답이면 예외를 발생시킵니다.
+        """
+        host = httpx.URL(url).host
+        async with self._host_semaphore(host):
+            limiter = self._host_rate_limiter(host)
+            if limiter is not None:
+                await limiter.acquire()
+            response = await self.client.get(url, params=params, headers=headers)
+        self.requests += 1
+        self.bytes_received += len(response.content)
+        if response.status_code != httpx.codes.NOT_MODIFIED:
+            response.raise_for_status()
+        return response
+
+    async def get_parsed(
+        self,
+        url: str,
+        parse: Callable[[bytes], Any],
+        params: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """
+        페이지를 가져와 parse(content) 결과를 반환합니다.
+        페이지가 바뀌지 않았으면 다시 파싱하지 않고 이전 결과를 반환합니다.
+        parse 는 CPU 작업이므로 스레드에서 실행합니다.
+        """
+        key = str(httpx.URL(url, params=params))
+        cached = self._validators.get(key)
+
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers['If-None-Match'] = cached.etag
+            if cached.last_modified:
+                headers['If-Modified-Since'] = cached.last_modified
+
+        response = await self.get(url, params=params, headers=headers)
+
+        if cached is not None and response.status_code == 304:
+            self.not_modified += 1
+            self.bytes_saved += cached.size
+            self.parse_skipped += 1
+            self._validators.move_to_end(key)
+            return cached.parsed
+
+        content = response.content
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if cached is not None and cached.digest == digest:
+            # 검증자를 지원하지 않는 서버라도 본문이 같으면 파싱은 건너뜁니다.
+            self.unchanged_bodies += 1
+            self.parse_skipped += 1
+            parsed = cached.parsed
+        else:
+            parsed = await asyncio.to_thread(parse, content)
+
+        self._validators[key] = _PageValidators(
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+            digest=digest,
+            size=len(content),
+            parsed=parsed,
+        )
+        self._validators.move_to_end(key)
+        while len(self._validators) > self.max_validator_entries:
+            self._validators.popitem(last=False)
+        return parsed
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "not_modified": self.not_modified,
+            "unchanged_bodies": self.unchanged_bodies,
+            "bytes_received": self.bytes_received,
+            "bytes_saved": self.bytes_saved,
+            "parse_skipped": self.parse_skipped,
+        }
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
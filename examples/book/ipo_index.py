@@ -0,0 +1,143 @@
+"""
+공모주 행(row) 검색 인덱스
+
+데이터를 새로 가져올 때 한 번만 만들고, 검색할 때는 행을 훑지 않고 인덱스만 조회합니다.
+
+- 정규화: NFKC(NFC/NFD 차이 제거) + casefold, 공백/기호를 뺀 compact 문자열로 비교합니다.
+  ("LG 에너지솔루션" == "LG에너지솔루션" == "lg에너지 솔루션")
+- 토큰 인덱스: 기업명을 한글/라틴/숫자 경계에서 나눈 토큰 -> 행 번호
+- 트라이그램 인덱스: compact 문자열의 3글자 조각 -> 행 번호
+  행 전체는 부분 일치 후보용, 기업명만은 오타 검색(유사도)용으로 따로 만듭니다.
+  날짜/가격 셀의 숫자 조각이 유사도나 토큰 점수에 섞이면 관련 없는 기업이 걸리기 때문입니다.
+"""
+
+import heapq
+import unicodedata
+from collections import Counter, defaultdict
+from typing import Iterable
+
+# 트라이그램 일치 비율이 이 값보다 낮은 후보는 결과에서 제외합니다.
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+
+def normalize(text: str) -> str:
+    return unicodedata.normalize('NFKC', text).casefold()
+
+
+def compact(text: str) -> str:
+    """정규화한 뒤 글자와 숫자만 남깁니다."""
+    return ''.join(ch for ch in normalize(text) if ch.isalnum())
+
+
+def _script(ch: str) -> str:
+    if ch.isdigit():
+        return 'digit'
+    if '가' <= ch <= '힣' or 'ᄀ' <= ch <= 'ᇿ' or '㄰' <= ch <= '㆏':
+        return 'hangul'
+    return 'other'
+
+
+def tokenize(text: str) -> list[str]:
+    """공백/기호와 문자 체계(한글, 라틴 등, 숫자)가 바뀌는 곳에서 나눕니다."""
+    tokens = []
+    current = []
+    current_script = None
+    for ch in normalize(text):
+        if not ch.isalnum():
+            if current:
+                tokens.append(''.join(current))
+                current = []
+            current_script = None
+            continue
+        script = _script(ch)
+        if current and script != current_script:
+            tokens.append(''.join(current))
+            current = []
+        current.append(ch)
+        current_script = script
+    if current:
+        tokens.append(''.join(current))
+    return tokens
+
+
+def trigrams(text: str) -> set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class IPOSearchIndex:
+    def __init__(self, rows: Iterable[list[str]]):
+        self.rows = list(rows)
+        # 행 전체(원래의 ' '.join(row) 검색 대상)와 첫 셀(기업명)을 따로 보관합니다.
+        self._row_texts = [compact(''.join(row)) for row in self.rows]
+        self._names = [compact(row[0]) if row else '' for row in self.rows]
+        self._tokens: dict[str, set[int]] = defaultdict(set)
+        self._trigrams: dict[str, set[int]] = defaultdict(set)
+        self._name_trigrams: dict[str, set[int]] = defaultdict(set)
+        for i, row in enumerate(self.rows):
+            if row:
+                for token in tokenize(row[0]):
+                    self._tokens[token].add(i)
+            for gram in trigrams(self._row_texts[i]):
+                self._trigrams[gram].add(i)
+            for gram in trigrams(self._names[i]):
+                self._name_trigrams[gram].add(i)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def search(self, query: str, limit: int = 20) -> list[list[str]]:
+        """
+        query 와 관련된 행을 점수가 높은 순서로 최대 limit 개 반환합니다.
+
+        기업명 완전 일치 > 기업명 부분 일치 > 행 부분 일치 > 기업명 트라이그램 유사도 순이며,
+        기업명 토큰이 그대로 일치하면 가산점을 줍니다. 유사도가 MIN_TRIGRAM_SIMILARITY 보다
+        낮은 행은 토큰이 일치해도 결과에 넣지 않습니다.
+        """
+        q = compact(query)
+        if not q:
+            return []
+
+        q_trigrams = trigrams(q)
+        q_tokens = tokenize(query)
+        token_hits = Counter()
+        for token in q_tokens:
+            token_hits.update(self._tokens.get(token, ()))
+
+        # 부분 일치 후보는 검색어의 모든 트라이그램을 가진 행이므로 포스팅 집합의 교집합으로 구합니다.
+        if q_trigrams:
+            postings = sorted((self._trigrams.get(gram, set()) for gram in q_trigrams), key=len)
+            candidates = set.intersection(*postings)
+        else:
+            # 1~2글자 검색어는 트라이그램이 없으므로 compact 문자열을 직접 확인합니다.
+            candidates = range(len(self.rows))
+
+        scored = []
+        matched = set()
+        for i in candidates:
+            name = self._names[i]
+            if q == name:
+                score = 4.0
+            elif q in name:
+                score = 3.0
+            elif q in self._row_texts[i]:
+                score = 2.0
+            else:
+                continue
+            matched.add(i)
+            scored.append((-(score + 0.5 * token_hits[i] / len(q_tokens)), i))
+
+        # 부분 일치가 부족할 때만 기업명 트라이그램 유사도로 비슷한 행을 찾습니다.
+        # 숫자만으로 된 조각("202", "025")은 연도/번호처럼 흔하므로 유사도에 넣지 않습니다.
+        fuzzy_trigrams = [gram for gram in q_trigrams if not gram.isdigit()]
+        if len(scored) < limit and fuzzy_trigrams:
+            counts = Counter()
+            for gram in fuzzy_trigrams:
+                counts.update(self._name_trigrams.get(gram, ()))
+            min_count = MIN_TRIGRAM_SIMILARITY * len(fuzzy_trigrams)
+            for i, count in counts.items():
+                if count < min_count or i in matched:
+                    continue
+                similarity = count / len(fuzzy_trigrams)
+                scored.append((-(similarity + 0.5 * token_hits[i] / len(q_tokens)), i))
+
+        return [self.rows[i] for _, i in heapq.nsmallest(limit, scored)]
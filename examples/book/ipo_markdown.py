@@ -0,0 +1,277 @@
+"""
+LLM 이 작성한 Markdown 분석 내용을 ReportLab flowable 로 바꾸는 단일 패스 변환기
+
+- 줄 단위로 한 번만 훑으며 제목(#, ##, ###, **제목**), 목록(-, *, +, 1.), 표(| a | b |),
+  구분선(---), 문단을 인식하고 굵게(**)/기울임(*) 을 ReportLab 마크업으로 바꿉니다.
+- flowable 은 제너레이터로 하나씩 만들고, LazyStory 가 doc.build() 에 필요한 만큼만
+  채워 넣으므로 분석 내용이 수 MB 여도 한 번에 메모리에 올라가는 flowable 수는 일정합니다.
+"""
+
+import re
+from typing import Iterable, Iterator
+
+from reportlab.lib import colors
+from reportlab.platypus import (
+    Flowable,
+    HRFlowable,
+    ListFlowable,
+    ListItem,
+    Paragraph,
+    Spacer,
+    Table,
+    TableStyle,
+)
+
+_HEADING = re.compile(r'(#{1,6})\s+(.*?)\s*#*\s*$')
+_BOLD_LINE = re.compile(r'\*\*([^*]+)\*\*:?$')
+_LIST_ITEM = re.compile(r'(\s*)([-*+]|\d{1,9}[.)])\s+(.*)$')
+_TABLE_SEPARATOR = re.compile(r'\|?\s*:?-{3,}:?\s*(\|\s*:?-{3,}:?\s*)*\|?$')
+_RULE = re.compile(r'(-{3,}|\*{3,}|_{3,})$')
+_EMPHASIS = re.compile(r'\*\*\*|\*\*|__|\*')
+_EMPHASIS_TAGS = {'**': 'b', '__': 'b', '*': 'i'}
+
+# 한 flowable 이 너무 커지지 않도록 문단/목록/표를 나누는 기준
+MAX_PARAGRAPH_CHARS = 16 * 1024
+MAX_LIST_ITEMS = 200
+MAX_TABLE_ROWS = 200
+
+_TABLE_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+])
+_TABLE_HEADER_STYLE = TableStyle([
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
+])
+
+
+def inline_markup(text: str) -> str:
+    """
+    &, <, > 를 이스케이프하고 **굵게**, __굵게__, *기울임* 을 <b>, <i> 로 바꿉니다.
+
+    강조 기호를 스택으로 짝지으므로 태그는 항상 올바르게 중첩됩니다.
+    '*a **b* c**' 처럼 엇갈리거나 닫히지 않은 기호는 글자 그대로 둡니다.
+    """
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    parts: list[str] = []
+    stack: list[tuple[str, int]] = []  # (기호, parts 에서 여는 태그의 위치)
+    position = 0
+    for match in _EMPHASIS.finditer(text):
+        start, end = match.start(), match.end()
+        parts.append(text[position:start])
+        position = end
+        before = text[start - 1] if start else ' '
+        after = text[end] if end < len(text) else ' '
+        markers = [match.group()]
+        if markers[0] == '***':
+            # ***굵은 기울임***: 기울임이 열려 있으면 그것부터 닫습니다.
+            markers = ['*', '**'] if stack and stack[-1][0] == '*' else ['**', '*']
+        for marker in markers:
+            if stack and stack[-1][0] == marker and not before.isspace():
+                parts.append(f"</{_EMPHASIS_TAGS[marker]}>")
+                stack.pop()
+            elif (
+                not after.isspace()
+                and not any(open_marker == marker for open_marker, _ in stack)
+                # 2*3*4 같은 곱셈은 기울임으로 보지 않습니다.
+                and not (marker == '*' and before.isalnum())
+            ):
+                stack.append((marker, len(parts)))
+                parts.append(f"<{_EMPHASIS_TAGS[marker]}>")
+            else:
+                parts.append(marker)
+    parts.append(text[position:])
+    # 닫히지 않은 기호는 글자 그대로 되돌립니다.
+    for marker, index in stack:
+        parts[index] = marker
+    return ''.join(parts)
+
+
+def markup_paragraph(text: str, style) -> Paragraph:
+    """
+    inline_markup 을 적용한 Paragraph 를 만듭니다. 그래도 ReportLab 이 마크업을 읽지 못하면
+    보고서 전체가 실패하지 않도록 이스케이프한 원문으로 만듭니다.
+    """
+    try:
+        return Paragraph(inline_markup(text), style)
+    except ValueError:
+        return Paragraph(text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;'), style)
+
+
+def iter_lines(text: str) -> Iterator[str]:
+    """text.splitlines() 처럼 전체 목록을 만들지 않고 한 줄씩 내보냅니다."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find('\n', start)
+        if end == -1:
+            end = length
+        yield text[start:end].rstrip('\r')
+        start = end + 1
+
+
+def _split_row(line: str) -> list[str]:
+    line = line.strip()
+    if line.startswith('|'):
+        line = line[1:]
+    if line.endswith('|'):
+        line = line[:-1]
+    return [cell.strip() for cell in line.split('|')]
+
+
+def iter_markdown_flowables(text: str, template, width: float) -> Iterator[Flowable]:
+    """
+    Markdown text 를 flowable 로 바꿔 하나씩 내보냅니다.
+
+    template 은 subtitle_style, heading3_style, content_style, list_style 속성을 가진
+    객체(ipo_report.ReportTemplate)이고, width 는 표 너비를 나눌 본문 폭입니다.
+    """
+    paragraph: list[str] = []
+    paragraph_chars = 0
+    list_items: list[list[str]] = []
+    list_ordered = False
+    list_start = 1
+    table_rows: list[list[str]] = []
+    table_has_header = False
+
+    def block(flowable: Flowable) -> Iterator[Flowable]:
+        yield flowable
+        yield Spacer(1, 6)
+
+    def flush_paragraph() -> Iterator[Flowable]:
+        nonlocal paragraph_chars
+        if paragraph:
+            yield from block(markup_paragraph(' '.join(paragraph), template.content_style))
+            paragraph.clear()
+            paragraph_chars = 0
+
+    def flush_list() -> Iterator[Flowable]:
+        nonlocal list_start
+        if list_items:
+            items = [ListItem(markup_paragraph(' '.join(item), template.list_style)) for item in list_items]
+            if list_ordered:
+                flowable = ListFlowable(items, bulletType='1', start=list_start, leftIndent=template.list_style.leftIndent)
+            else:
+                flowable = ListFlowable(items, bulletType='bullet', start='•', leftIndent=template.list_style.leftIndent)
+            list_start += len(list_items)
+            list_items.clear()
+            yield from block(flowable)
+
+    def flush_table() -> Iterator[Flowable]:
+        nonlocal table_has_header
+        if table_rows:
+            columns = max(len(row) for row in table_rows)
+            data = [
+                [markup_paragraph(cell, template.table_cell_style) for cell in row + [''] * (columns - len(row))]
+                for row in table_rows
+            ]
+            table = Table(data, colWidths=[width / columns] * columns, repeatRows=1 if table_has_header else 0)
+            table.setStyle(_TABLE_HEADER_STYLE if table_has_header else _TABLE_STYLE)
+            table_rows.clear()
+            table_has_header = False
+            yield from block(table)
+
+    def flush_all() -> Iterator[Flowable]:
+        yield from flush_paragraph()
+        yield from flush_list()
+        yield from flush_table()
+
+    for raw_line in iter_lines(text):
+        line = raw_line.strip()
+
+        if not line:
+            yield from flush_all()
+            continue
+
+        if line.startswith('|'):
+            yield from flush_paragraph()
+            yield from flush_list()
+            if _TABLE_SEPARATOR.match(line):
+                # 첫 줄 다음의 |---|---| 는 머리글 행 표시입니다.
+                table_has_header = len(table_rows) == 1
+                continue
+            table_rows.append(_split_row(line))
+            if len(table_rows) >= MAX_TABLE_ROWS:
+                yield from flush_table()
+            continue
+        yield from flush_table()
+
+        heading = _HEADING.match(line)
+        bold_line = None if heading else _BOLD_LINE.match(line)
+        if heading or bold_line:
+            yield from flush_all()
+            if heading:
+                level, title = len(heading.group(1)), heading.group(2)
+            else:
+                level, title = 2, bold_line.group(1)
+            style = template.subtitle_style if level <= 2 else template.heading3_style
+            yield from block(markup_paragraph(title, style))
+            continue
+
+        if _RULE.match(line):
+            yield from flush_all()
+            yield from block(HRFlowable(width='100%', thickness=0.5, color=colors.grey))
+            continue
+
+        item = _LIST_ITEM.match(raw_line)
+        if item:
+            yield from flush_paragraph()
+            ordered = item.group(2)[0].isdigit()
+            if list_items and ordered != list_ordered:
+                yield from flush_list()
+            if not list_items:
+                list_ordered = ordered
+                list_start = int(item.group(2)[:-1]) if ordered else 1
+            list_items.append([item.group(3)])
+            if len(list_items) >= MAX_LIST_ITEMS:
+                yield from flush_list()
+            continue
+
+        if list_items and raw_line[:1].isspace():
+            # 들여쓴 줄은 앞 목록 항목에 이어 붙입니다.
+            list_items[-1].append(line)
+            continue
+
+        yield from flush_list()
+        paragraph.append(line)
+        paragraph_chars += len(line)
+        if paragraph_chars >= MAX_PARAGRAPH_CHARS:
+            yield from flush_paragraph()
+
+    yield from flush_all()
+
+
+class LazyStory(list):
+    """
+    doc.build() 에 넘기는 story 목록을 제너레이터에서 필요한 만큼만 채웁니다.
+
+    ReportLab 은 story 를 앞에서부터 꺼내(del flowables[0]) 배치하므로 앞쪽 lookahead 개만
+    메모리에 있으면 됩니다. len() 은 남은 flowable 이 있는 동안 0 이 되지 않습니다.
+    """
+
+    def __init__(self, flowables: Iterable[Flowable], lookahead: int = 64):
+        super().__init__()
+        self._source = iter(flowables)
+        self._lookahead = lookahead
+
+    def _fill(self, size: int) -> None:
+        while self._source is not None and list.__len__(self) < size:
+            try:
+                self.append(next(self._source))
+            except StopIteration:
+                self._source = None
+
+    def __len__(self) -> int:
+        self._fill(self._lookahead)
+        return list.__len__(self)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice) or index < 0:
+            self._fill(self._lookahead)
+        else:
+            self._fill(index + 1)
+        return list.__getitem__(self, index)
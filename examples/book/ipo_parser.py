@@ -0,0 +1,74 @@
+"""
+38커뮤니케이션 / DART 페이지에서 필요한 테이블만 파싱하는 추출기
+
+- SoupStrainer 로 공모주 목록 테이블(summary="공모주 청약일정")만 트리로 만들고
+  나머지 태그는 버립니다. 페이지 구조가 바뀌어 그 테이블이 없으면 모든 <table> 로 다시 찾습니다.
+- 행은 제너레이터로 하나씩 내보내며, 열 제목 행(<th> 또는 첫 셀이 '기업명')은 내보내지 않습니다.
+- 다 읽으면 트리를 바로 decompose() 하여 메모리를 돌려줍니다.
+"""
+
+from typing import Iterator
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+IPO_ROW_KEYWORDS = ('기업명', '공모가', '상장일', '공모주')
+_HEADER_FIRST_CELL = '기업명'
+
+# 38커뮤니케이션 페이지는 레이아웃도 <table> 이므로 목록 테이블의 summary 로 좁힙니다.
+_LISTING_TABLE = SoupStrainer('table', attrs={'summary': '공모주 청약일정'})
+_TABLES = SoupStrainer('table')
+_DART_RESULT_TABLE = SoupStrainer('table', class_='tb_list')
+
+
+def iter_ipo_rows(content: bytes) -> Iterator[list[str]]:
+    """
+    공모주 목록 페이지에서 3개 이상의 셀을 가지며 공모주 관련 키워드가 들어간 행을 내보냅니다.
+    """
+    found = False
+    for row_data in _iter_keyword_rows(content, _LISTING_TABLE):
+        found = True
+        yield row_data
+    if not found:
+        yield from _iter_keyword_rows(content, _TABLES)
+
+
+def _iter_keyword_rows(content: bytes, strainer: SoupStrainer) -> Iterator[list[str]]:
+    soup = BeautifulSoup(content, 'html.parser', parse_only=strainer)
+    try:
+        # 중첩 테이블의 행을 두 번 세지 않도록 <tr> 을 문서 순서대로 한 번만 훑습니다.
+        for row in soup.find_all('tr'):
+            cells = row.find_all(['td', 'th'])
+            if len(cells) < 3:  # 최소 3개 컬럼이 있는 행만 처리
+                continue
+            row_data = [cell.get_text(strip=True) for cell in cells]
+            # 열 제목 행이 '기업명' 이라는 기업으로 저장되지 않도록 건너뜁니다.
+            if any(cell.name == 'th' for cell in cells) or row_data[0] == _HEADER_FIRST_CELL:
+                continue
+            # 키워드는 공백이 없는 한글이므로 행을 합치거나 소문자로 바꾸지 않고 셀 단위로 확인합니다.
+            if any(keyword in text for text in row_data for keyword in IPO_ROW_KEYWORDS):
+                yield row_data
+    finally:
+        soup.decompose()
+
+
+def iter_reports(content: bytes, limit: int = 10) -> Iterator[dict[str, str]]:
+    """
+    DART 공시서류검색 결과(table.tb_list)에서 최근 증권신고서를 최대 limit 개 내보냅니다.
+    """
+    soup = BeautifulSoup(content, 'html.parser', parse_only=_DART_RESULT_TABLE)
+    try:
+        table = soup.find('table')
+        if table is None:
+            return
+        rows = table.find_all('tr', limit=limit + 1)[1:]  # 헤더 제외
+        for row in rows:
+            cells = row.find_all(['td', 'th'], limit=5)
+            if len(cells) >= 5:
+                yield {
+                    'company': cells[1].get_text(strip=True),
+                    'report_name': cells[2].get_text(strip=True),
+                    'submitter': cells[3].get_text(strip=True),
+                    'date': cells[4].get_text(strip=True),
+                }
+    finally:
+        soup.decompose()
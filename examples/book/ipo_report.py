@@ -0,0 +1,560 @@
+"""
+IPO 분석 PDF 보고서 렌더링
+
+ReportLab 의 doc.build() 는 순수 CPU 작업이라 서버 프로세스에서 실행하면 다른 도구 호출이
+모두 멈춥니다. ReportRenderer 는 렌더링을 프로세스 풀로 보내고, 작업 번호로 진행 상태를
+조회할 수 있게 합니다.
+"""
+
+import asyncio
+import hashlib
+import io
+import itertools
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import IO, Optional, Union
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+from reportlab.lib.units import inch
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+from ipo_cache import SingleFlight
+from ipo_markdown import LazyStory, iter_markdown_flowables
+
+
+def default_report_filename(company_name: Optional[str]) -> str:
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if company_name:
+        return f"IPO_Analysis_{company_name}_{timestamp}.pdf"
+    return f"IPO_Market_Analysis_{timestamp}.pdf"
+
+
+def default_report_spill_dir() -> str:
+    return os.path.join(os.path.expanduser("~"), ".cache", "ipo_analyzer", "reports")
+
+
+def report_digest(company_name: Optional[str], analysis_content: str) -> str:
+    """같은 기업명 + 분석 내용이면 같은 값을 반환합니다. (렌더링 결과 캐시 키)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update((company_name or '').encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(analysis_content.encode('utf-8'))
+    return digest.hexdigest()
+
+
+# ReportLab 에 내장된 한글 CID 폰트 (별도의 폰트 파일이 필요 없습니다)
+BODY_FONT = 'HYSMyeongJo-Medium'
+HEADING_FONT = 'HYGothic-Medium'
+
+DISCLAIMER = """
+<b>면책조항:</b><br/>
+본 보고서는 투자 참고용으로만 사용되어야 하며, 투자 권유가 아닙니다.
+투자 결정은 개인의 판단과 책임하에 이루어져야 합니다.
+과거 성과가 미래 수익을 보장하지 않으며, 투자에는 원금 손실 위험이 있습니다.
+"""
+
+
+class ReportTemplate:
+    """
+    보고서마다 바뀌지 않는 부분(폰트 등록, 스타일, 표 스타일, 고정 문단)을 한 번만 만들어 둡니다.
+    build() 는 기업명/분석일자/분석 내용만 새로 배치합니다.
+    """
+
+    def __init__(self):
+        for font_name in (BODY_FONT, HEADING_FONT):
+            pdfmetrics.registerFont(UnicodeCIDFont(font_name))
+        # <b> 태그가 한글 폰트의 굵은 글꼴을 찾을 수 있도록 글꼴 패밀리를 등록합니다.
+        pdfmetrics.registerFontFamily(BODY_FONT, normal=BODY_FONT, bold=HEADING_FONT, italic=BODY_FONT, boldItalic=HEADING_FONT)
+        pdfmetrics.registerFontFamily(HEADING_FONT, normal=HEADING_FONT, bold=HEADING_FONT, italic=HEADING_FONT, boldItalic=HEADING_FONT)
+
+        styles = getSampleStyleSheet()
+
+        # 제목 스타일
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontName=HEADING_FONT,
+            fontSize=18,
+            spaceAfter=30,
+            alignment=1,  # 중앙 정렬
+            textColor=colors.darkblue
+        )
+
+        # 부제목 스타일
+        self.subtitle_style = ParagraphStyle(
+            'CustomSubtitle',
+            parent=styles['Heading2'],
+            fontName=HEADING_FONT,
+            fontSize=14,
+            spaceAfter=12,
+            textColor=colors.darkgreen
+        )
+
+        # 내용 스타일
+        self.content_style = ParagraphStyle(
+            'CustomContent',
+            parent=styles['Normal'],
+            fontName=BODY_FONT,
+            fontSize=11,
+            spaceAfter=6,
+            leftIndent=20
+        )
+
+        # 분석 내용의 ### 이하 제목, 목록 항목, 표 칸 스타일
+        self.heading3_style = ParagraphStyle(
+            'CustomHeading3',
+            parent=styles['Heading3'],
+            fontName=HEADING_FONT,
+            fontSize=12,
+            spaceAfter=6,
+            leftIndent=10
+        )
+        self.list_style = ParagraphStyle(
+            'CustomListItem',
+            parent=self.content_style,
+            spaceAfter=2,
+            leftIndent=30
+        )
+        self.table_cell_style = ParagraphStyle(
+            'CustomTableCell',
+            parent=styles['Normal'],
+            fontName=BODY_FONT,
+            fontSize=10
+        )
+
+        self.basic_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), BODY_FONT),
+            ('FONTNAME', (0, 0), (-1, 0), HEADING_FONT),
+            ('FONTSIZE', (0, 0), (-1, 0), 12),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+
+        # 고정 문단은 미리 파싱해 두고 보고서마다 재사용합니다. (키: 기업 보고서 여부)
+        self.titles = {
+            True: Paragraph("공모주 투자 분석 보고서", self.title_style),
+            False: Paragraph("공모주 시장 분석 보고서", self.title_style),
+        }
+        self.result_titles = {
+            True: Paragraph("투자 분석 결과", self.subtitle_style),
+            False: Paragraph("시장 분석 결과", self.subtitle_style),
+        }
+        self.basic_info_title = Paragraph("기본 정보", self.subtitle_style)
+        self.disclaimer = [Spacer(1, 20), Paragraph(DISCLAIMER, self.content_style)]
+
+    def build(self, company_name: Optional[str], analysis_content: str, output: Union[str, IO[bytes]]) -> None:
+        """output 은 파일 경로 또는 쓰기 가능한 바이너리 파일 객체(io.BytesIO 등)입니다."""
+        doc = SimpleDocTemplate(output, pagesize=A4)
+        is_company = bool(company_name)
+
+        # 제목
+        story = [self.titles[is_company], Spacer(1, 20)]
+
+        # 기본 정보 테이블
+        basic_info = [
+            ['항목', '내용'],
+            ['분석일자', datetime.now().strftime("%Y년 %m월 %d일")],
+            ['데이터 소스', '38커뮤니케이션 + DART 전자공시시스템'],
+        ]
+        if company_name:
+            basic_info.insert(1, ['기업명', company_name])
+
+        basic_table = Table(basic_info, colWidths=[2*inch, 4*inch])
+        basic_table.setStyle(self.basic_table_style)
+
+        story += [self.basic_info_title, basic_table, Spacer(1, 20)]
+
+        # 분석 내용
+        story.append(self.result_titles[is_company])
+
+        # 분석 내용(Markdown)은 한 번 훑으면서 flowable 을 만들고, 면책조항을 이어 붙입니다.
+        # LazyStory 가 doc.build() 가 소비하는 만큼만 채우므로 긴 분석 내용도 메모리 사용이 일정합니다.
+        body = iter_markdown_flowables(analysis_content, self, doc.width)
+        doc.build(LazyStory(itertools.chain(story, body, self.disclaimer)))
+
+
+_template: Optional[ReportTemplate] = None
+
+
+def get_template() -> ReportTemplate:
+    """프로세스마다 한 번만 ReportTemplate 을 만듭니다. 워커 시작 시 initializer 로도 호출됩니다."""
+    global _template
+    if _template is None:
+        _template = ReportTemplate()
+    return _template
+
+
+def render_report(company_name: Optional[str], analysis_content: str, output_filename: str) -> str:
+    """
+    IPO 분석 결과를 PDF 로 렌더링하여 output_filename 에 저장하고 파일명을 반환합니다.
+    프로세스 풀 워커에서 실행되므로 모듈 최상위 함수로 둡니다.
+    """
+    get_template().build(company_name, analysis_content, output_filename)
+    return output_filename
+
+
+def render_report_bytes(company_name: Optional[str], analysis_content: str) -> bytes:
+    """파일을 만들지 않고 메모리 버퍼에 렌더링한 PDF 바이트를 반환합니다."""
+    buffer = io.BytesIO()
+    get_template().build(company_name, analysis_content, buffer)
+    return buffer.getvalue()
+
+
+@dataclass
+class StoredReport:
+    """렌더링된 PDF. 작은 보고서는 data 에, spill_threshold 를 넘는 보고서는 path 의 파일에 있습니다."""
+    digest: str
+    size: int
+    data: Optional[bytes] = None
+    path: Optional[str] = None
+
+    def read(self) -> bytes:
+        if self.data is not None:
+            return self.data
+        with open(self.path, 'rb') as f:
+            return f.read()
+
+
+class ReportBlobCache:
+    """
+    report_digest() 를 키로 렌더링된 PDF 를 보관합니다.
+
+    spill_threshold 보다 큰 PDF 는 spill_dir 에 <digest>.pdf 로 저장하고 경로만 기억합니다.
+    메모리의 PDF 는 합계 max_bytes, 디스크의 PDF 는 합계 max_spill_bytes, 항목 수는 max_entries 까지
+    유지하고, 넘으면 가장 오래 쓰지 않은 것부터 버리며 디스크의 파일도 지웁니다.
+    이전 실행이 spill_dir 에 남긴 PDF 는 처음 사용할 때 오래된 순서로 읽어 들여 같은 상한을 적용합니다.
+
+    이벤트 루프와 asyncio.to_thread 의 작업 스레드에서 함께 호출하므로 lock 으로 보호합니다.
+    """
+
+    # 이 시간(초)보다 오래된 *.tmp 는 쓰다가 중단된 파일로 보고 지웁니다.
+    STALE_TMP_SECONDS = 3600
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        spill_threshold: int = 8 * 1024 * 1024,
+        spill_dir: Optional[str] = None,
+        max_spill_bytes: int = 1024 * 1024 * 1024,
+        max_entries: int = 1024,
+    ):
+        self.max_bytes = max_bytes
+        self.spill_threshold = spill_threshold
+        self.spill_dir = spill_dir or default_report_spill_dir()
+        self.max_spill_bytes = max_spill_bytes
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, StoredReport] = OrderedDict()
+        self._bytes = 0
+        self._spill_bytes = 0
+        self._scanned = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.spilled = 0
+        self.evictions = 0
+
+    def get(self, digest: str) -> Optional[StoredReport]:
+        with self._lock:
+            stale = self._scan_spill_dir()
+            stored = self._entries.get(digest)
+            if stored is None:
+                # 다른 프로세스가 디스크로 내보낸 보고서가 있으면 그대로 사용합니다.
+                path = os.path.join(self.spill_dir, f"{digest}.pdf")
+                if os.path.exists(path):
+                    stored = self._add(StoredReport(digest, os.path.getsize(path), path=path))
+                    stale += self._evict()
+            elif stored.path is not None and not os.path.exists(stored.path):
+                self._remove(digest)
+                stored = None
+
+            if stored is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(digest)
+                self.hits += 1
+        _unlink(stale)
+        return stored
+
+    def put(self, digest: str, pdf: bytes) -> StoredReport:
+        """PDF 를 저장합니다. 파일 쓰기가 있을 수 있으므로 이벤트 루프 밖에서 호출합니다."""
+        if len(pdf) > self.spill_threshold:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            path = os.path.join(self.spill_dir, f"{digest}.pdf")
+            # 다른 프로세스가 쓰다 만 파일을 읽지 않도록 임시 파일에 쓴 뒤 이름을 바꿉니다.
+            fd, tmp_path = tempfile.mkstemp(dir=self.spill_dir, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(pdf)
+            os.replace(tmp_path, path)
+            stored = StoredReport(digest, len(pdf), path=path)
+        else:
+            stored = StoredReport(digest, len(pdf), data=pdf)
+
+        with self._lock:
+            stale = self._scan_spill_dir()
+            previous = self._remove(digest)
+            if previous is not None and previous.path is not None and stored.path is None:
+                stale.append(previous.path)
+            if stored.path is not None:
+                self.spilled += 1
+            self._add(stored)
+            stale += self._evict()
+        _unlink(stale)
+        return stored
+
+    def _add(self, stored: StoredReport) -> StoredReport:
+        self._entries[stored.digest] = stored
+        if stored.data is not None:
+            self._bytes += stored.size
+        else:
+            self._spill_bytes += stored.size
+        return stored
+
+    def _remove(self, digest: str) -> Optional[StoredReport]:
+        stored = self._entries.pop(digest, None)
+        if stored is not None:
+            if stored.data is not None:
+                self._bytes -= stored.size
+            else:
+                self._spill_bytes -= stored.size
+        return stored
+
+    def _evict(self) -> list[str]:
+        """상한을 넘는 만큼 오래된 항목을 버리고, 지울 파일 경로를 반환합니다."""
+        paths = []
+        for digest in list(self._entries):
+            over_memory = self._bytes > self.max_bytes
+            over_spill = self._spill_bytes > self.max_spill_bytes
+            over_count = len(self._entries) > self.max_entries
+            if not (over_memory or over_spill or over_count):
+                break
+            stored = self._entries[digest]
+            if over_count or (over_memory if stored.data is not None else over_spill):
+                self._remove(digest)
+                self.evictions += 1
+                if stored.path is not None:
+                    paths.append(stored.path)
+        return paths
+
+    def _scan_spill_dir(self) -> list[str]:
+        """처음 한 번 spill_dir 의 PDF 를 오래된 순서로 등록하고, 지울 파일 경로를 반환합니다."""
+        if self._scanned:
+            return []
+        self._scanned = True
+        try:
+            names = os.listdir(self.spill_dir)
+        except FileNotFoundError:
+            return []
+
+        stale = []
+        found = []
+        now = time.time()
+        for name in names:
+            path = os.path.join(self.spill_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            if name.endswith('.pdf'):
+                found.append((stat.st_mtime, name[:-4], path, stat.st_size))
+            elif name.endswith('.tmp') and now - stat.st_mtime > self.STALE_TMP_SECONDS:
+                stale.append(path)
+
+        # 이미 메모리에 있는 항목보다 먼저 버려지도록 LRU 의 앞쪽에 둡니다.
+        for _, digest, path, size in sorted(found, reverse=True):
+            if digest not in self._entries:
+                self._add(StoredReport(digest, size, path=path))
+                self._entries.move_to_end(digest, last=False)
+        return stale + self._evict()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "spill_bytes": self._spill_bytes,
+                "max_spill_bytes": self.max_spill_bytes,
+                "spill_threshold": self.spill_threshold,
+                "hits": self.hits,
+                "misses": self.misses,
+                "spilled": self.spilled,
+                "evictions": self.evictions,
+            }
+
+
+def _unlink(paths: list[str]) -> None:
+    for path in paths:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+
+class QueueFullError(Exception):
+    pass
+
+
+@dataclass
+class ReportJob:
+    job_id: str
+    company_name: Optional[str]
+    output_filename: str
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+    future: Optional[asyncio.Future] = None
+
+    @property
+    def status(self) -> str:
+        if self.finished_at is None:
+            return "running"
+        return "failed" if self.error else "done"
+
+
+class ReportRenderer:
+    """
+    render_report / render_report_bytes 를 프로세스 풀에서 실행합니다.
+
+    max_workers 개의 워커가 동시에 렌더링하고, 나머지 작업은 풀의 대기열에서 기다립니다.
+    대기 중이거나 실행 중인 작업이 max_pending 개를 넘으면 QueueFullError 를 발생시킵니다.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        keep_finished: int = 100,
+        blobs: Optional[ReportBlobCache] = None,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_pending = max_pending or self.max_workers * 4
+        self.keep_finished = keep_finished
+        self.blobs = blobs or ReportBlobCache()
+        self._blob_flight = SingleFlight()
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: OrderedDict[str, ReportJob] = OrderedDict()
+        self._ids = itertools.count(1)
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # 서버 프로세스의 스레드/이벤트 루프를 fork 하지 않도록 spawn 으로 워커를 띄웁니다.
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                # 워커가 뜰 때 폰트/스타일을 미리 준비해 첫 보고서도 빠르게 렌더링합니다.
+                initializer=get_template,
+            )
+        return self._executor
+
+    def _check_capacity(self) -> None:
+        if self.pending >= self.max_pending:
+            raise QueueFullError(f"보고서 생성 대기열이 가득 찼습니다 (최대 {self.max_pending}건).")
+
+    def _run_in_pool(self, fn, *args) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        try:
+            return loop.run_in_executor(self.executor, fn, *args)
+        except BrokenProcessPool:
+            # 워커가 비정상 종료되어 풀을 쓸 수 없으면 새 풀을 만들어 한 번 더 시도합니다.
+            self.shutdown()
+            return loop.run_in_executor(self.executor, fn, *args)
+
+    def submit(self, company_name: Optional[str], analysis_content: str, output_filename: Optional[str] = None) -> ReportJob:
+        self._check_capacity()
+
+        job = ReportJob(
+            job_id=f"report-{next(self._ids)}",
+            company_name=company_name,
+            output_filename=output_filename or default_report_filename(company_name),
+        )
+        job.future = self._run_in_pool(render_report, company_name, analysis_content, job.output_filename)
+        job.future.add_done_callback(lambda future: self._finish(job, future))
+        self.pending += 1
+        self._jobs[job.job_id] = job
+        self._prune()
+        return job
+
+    async def render(self, company_name: Optional[str], analysis_content: str, output_filename: Optional[str] = None) -> str:
+        job = self.submit(company_name, analysis_content, output_filename)
+        return await asyncio.shield(job.future)
+
+    async def render_bytes(self, company_name: Optional[str], analysis_content: str) -> StoredReport:
+        """
+        파일을 남기지 않고 메모리에서 렌더링한 PDF 를 반환합니다.
+        같은 기업명 + 분석 내용은 blobs 캐시에서 바로 반환하고, 동시에 들어온 같은 요청은 한 번만 렌더링합니다.
+        """
+        digest = report_digest(company_name, analysis_content)
+        # 처음 조회할 때 spill_dir 를 훑고 오래된 파일을 지우므로 디스크 I/O 는 스레드에서 합니다.
+        stored = await asyncio.to_thread(self.blobs.get, digest)
+        if stored is not None:
+            return stored
+        return await self._blob_flight.do(digest, lambda: self._render_blob(digest, company_name, analysis_content))
+
+    async def _render_blob(self, digest: str, company_name: Optional[str], analysis_content: str) -> StoredReport:
+        self._check_capacity()
+        self.pending += 1
+        try:
+            pdf = await self._run_in_pool(render_report_bytes, company_name, analysis_content)
+        except BaseException:
+            self.failed += 1
+            raise
+        finally:
+            self.pending -= 1
+        self.completed += 1
+        return await asyncio.to_thread(self.blobs.put, digest, pdf)
+
+    def get(self, job_id: str) -> Optional[ReportJob]:
+        return self._jobs.get(job_id)
+
+    def _finish(self, job: ReportJob, future: asyncio.Future) -> None:
+        self.pending -= 1
+        job.finished_at = time.time()
+        if future.cancelled():
+            job.error = "cancelled"
+        elif future.exception() is not None:
+            job.error = str(future.exception())
+        if job.error:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    def _prune(self) -> None:
+        finished = [job_id for job_id, job in self._jobs.items() if job.finished_at is not None]
+        for job_id in finished[:max(0, len(finished) - self.keep_finished)]:
+            del self._jobs[job_id]
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "completed": self.completed,
+            "failed": self.failed,
+            "blobs": self.blobs.stats(),
+        }
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
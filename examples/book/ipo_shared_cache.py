@@ -0,0 +1,170 @@
+"""
+같은 컴퓨터에서 실행 중인 모든 ipo_analyzer 서버 프로세스가 공유하는 캐시
+
+데스크톱 클라이언트는 세션마다 practice.py 프로세스를 따로 띄우므로, 프로세스 내 캐시만으로는
+세션 수만큼 38커뮤니케이션 / DART 에 요청하게 됩니다. 이 캐시는 WAL 모드 SQLite 파일 하나를
+여러 프로세스가 함께 사용하여 한 번 가져온 결과를 나눠 씁니다.
+
+- 값은 TTL 이 지나면 무시되고, 전체 크기가 max_bytes 를 넘으면 오래된 값부터 지웁니다.
+- 값이 없을 때는 lease(임대) 를 얻은 프로세스 하나만 가져오고,
+  나머지 프로세스는 그 결과가 저장될 때까지 기다립니다.
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable, Optional
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key        TEXT PRIMARY KEY,
+    value      BLOB NOT NULL,
+    size       INTEGER NOT NULL,
+    stored_at  REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_stored_at ON entries (stored_at);
+
+CREATE TABLE IF NOT EXISTS leases (
+    key        TEXT PRIMARY KEY,
+    owner      TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def default_shared_cache_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".cache", "ipo_analyzer", "shared_cache.sqlite3")
+
+
+class SharedCache:
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 32 * 1024 * 1024,
+        lease_ttl: float = 30.0,
+        poll_interval: float = 0.2,
+    ):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lease_ttl = lease_ttl
+        self.poll_interval = poll_interval
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        # 트랜잭션은 직접 BEGIN IMMEDIATE 로 시작합니다.
+        self._conn = sqlite3.connect(path, timeout=10.0, isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SCHEMA)
+        self.hits = 0
+        self.misses = 0
+        self.waits = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT value FROM entries WHERE key = ? AND expires_at > ?', (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, value, size, stored_at, expires_at) VALUES (?, ?, ?, ?, ?)',
+                    (key, value, len(value), now, now + ttl),
+                )
+                self.evictions += self._evict(now)
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def _evict(self, now: float) -> int:
+        evicted = self._conn.execute('DELETE FROM entries WHERE expires_at <= ?', (now,)).rowcount
+        total = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total <= self.max_bytes:
+            return evicted
+        # 크기 제한을 넘으면 가장 오래전에 저장한 값부터 지웁니다.
+        for key, size in self._conn.execute('SELECT key, size FROM entries ORDER BY stored_at').fetchall():
+            if total <= self.max_bytes:
+                break
+            self._conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def try_acquire(self, key: str) -> bool:
+        """key 를 가져올 lease 를 얻으면 True 를 반환합니다. 만료된 lease 는 넘겨받을 수 있습니다."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute('DELETE FROM leases WHERE key = ? AND expires_at <= ?', (key, now))
+                acquired = self._conn.execute(
+                    'INSERT OR IGNORE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)',
+                    (key, self.owner, now + self.lease_ttl),
+                ).rowcount == 1
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return acquired
+
+    def release(self, key: str) -> None:
+        with self._lock:
+            self._conn.execute('DELETE FROM leases WHERE key = ? AND owner = ?', (key, self.owner))
+
+    async def get_or_fetch(self, key: str, fetch: Callable[[], Awaitable[bytes]], ttl: float) -> bytes:
+        """
+        다른 프로세스가 저장한 값이 있으면 그대로 반환하고, 없으면 lease 를 얻은
+        프로세스 하나만 await fetch() 로 가져와 저장합니다.
+        """
+        waited = False
+        while True:
+            value = await asyncio.to_thread(self.get, key)
+            if value is not None:
+                if waited:
+                    self.waits += 1
+                else:
+                    self.hits += 1
+                return value
+
+            if await asyncio.to_thread(self.try_acquire, key):
+                break
+            # 다른 프로세스가 가져오는 중입니다. 결과가 저장되거나 lease 가 만료될 때까지 기다립니다.
+            waited = True
+            await asyncio.sleep(self.poll_interval)
+
+        self.misses += 1
+        try:
+            value = await fetch()
+            await asyncio.to_thread(self.set, key, value, ttl)
+            return value
+        finally:
+            await asyncio.to_thread(self.release, key)
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            entries, size = self._conn.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries').fetchone()
+        return {
+            "path": self.path,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "waits": self.waits,
+            "evictions": self.evictions,
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,201 @@
+"""
+공모주 목록 행과 DART 증권신고서 메타데이터를 저장하는 SQLite 스냅샷 저장소
+
+- 공모주 행은 (기업명, 상장/청약일) 로, 증권신고서는 (검색 기업명, 보고서명, 접수일) 로 구분합니다.
+- upsert 시 내용 해시가 같은 행은 updated_at 을 바꾸지 않으므로
+  changes_since() 로 "그 이후에 바뀐 것" 만 조회할 수 있습니다.
+- 서버를 다시 시작하면 저장된 행으로 곧바로 응답할 수 있습니다.
+
+sqlite3 호출은 블로킹이므로 비동기 코드에서는 asyncio.to_thread 로 호출합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Iterable
+
+_DATE = re.compile(r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS ipo_rows (
+    company      TEXT NOT NULL,
+    listing_date TEXT NOT NULL,
+    cells        TEXT NOT NULL,
+    row_hash     TEXT NOT NULL,
+    position     INTEGER NOT NULL,
+    first_seen   TEXT NOT NULL,
+    updated_at   TEXT NOT NULL,
+    PRIMARY KEY (company, listing_date)
+);
+-- 기업명 조회는 기본 키 (company, listing_date) 인덱스를 사용합니다.
+CREATE INDEX IF NOT EXISTS idx_ipo_rows_listing_date ON ipo_rows (listing_date);
+CREATE INDEX IF NOT EXISTS idx_ipo_rows_updated_at ON ipo_rows (updated_at);
+
+CREATE TABLE IF NOT EXISTS dart_reports (
+    company       TEXT NOT NULL,
+    report_name   TEXT NOT NULL,
+    date          TEXT NOT NULL,
+    submitter     TEXT NOT NULL,
+    filer_company TEXT NOT NULL,
+    first_seen    TEXT NOT NULL,
+    PRIMARY KEY (company, report_name, date)
+);
+CREATE INDEX IF NOT EXISTS idx_dart_reports_date ON dart_reports (date);
+CREATE INDEX IF NOT EXISTS idx_dart_reports_first_seen ON dart_reports (first_seen);
+"""
+
+
+def default_store_path() -> str:
+    return os.path.join(os.path.expanduser("~"), ".cache", "ipo_analyzer", "snapshots.sqlite3")
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec='seconds')
+
+
+def listing_date(row: list[str]) -> str:
+    """행에서 처음 나오는 날짜(예: 2025.10.20~10.21 의 시작일)를 YYYY-MM-DD 로 반환합니다."""
+    for cell in row:
+        match = _DATE.search(cell)
+        if match:
+            year, month, day = match.groups()
+            return f"{year}-{int(month):02d}-{int(day):02d}"
+    return ''
+
+
+class SnapshotStore:
+    def __init__(self, path: str):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_SCHEMA)
+
+    def upsert_ipo_rows(self, rows: Iterable[list[str]]) -> int:
+        """
+        현재 페이지의 공모주 행을 저장하고 실제로 쓴 행 수를 반환합니다.
+        같은 키의 중복 행은 페이지에서 먼저 나온 행을 사용하고,
+        페이지에서 사라진 행은 지우지 않고 position 을 -1 로 표시합니다.
+        """
+        now = _now()
+        params = []
+        seen = set()
+        for position, row in enumerate(rows):
+            if not row:
+                continue
+            key = (row[0], listing_date(row))
+            if key in seen:
+                continue
+            seen.add(key)
+            cells = json.dumps(row, ensure_ascii=False)
+            row_hash = hashlib.blake2b(cells.encode('utf-8'), digest_size=16).hexdigest()
+            params.append((*key, cells, row_hash, position, now, now))
+
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            # 내용(row_hash)과 순서(position)가 모두 같은 행은 건드리지 않고,
+            # updated_at 은 내용이 바뀐 경우에만 갱신합니다.
+            self._conn.executemany(
+                """
+                INSERT INTO ipo_rows (company, listing_date, cells, row_hash, position, first_seen, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (company, listing_date) DO UPDATE SET
+                    cells = excluded.cells,
+                    position = excluded.position,
+                    updated_at = CASE WHEN ipo_rows.row_hash != excluded.row_hash
+                                      THEN excluded.updated_at ELSE ipo_rows.updated_at END,
+                    row_hash = excluded.row_hash
+                WHERE ipo_rows.row_hash != excluded.row_hash OR ipo_rows.position != excluded.position
+                """,
+                params,
+            )
+            listed = self._conn.execute(
+                'SELECT company, listing_date FROM ipo_rows WHERE position >= 0'
+            ).fetchall()
+            self._conn.executemany(
+                'UPDATE ipo_rows SET position = -1 WHERE company = ? AND listing_date = ?',
+                [key for key in listed if key not in seen],
+            )
+            return self._conn.total_changes - before
+
+    def load_ipo_rows(self) -> list[list[str]]:
+        """가장 최근에 저장한 페이지의 공모주 행을 페이지 순서대로 반환합니다."""
+        with self._lock:
+            cursor = self._conn.execute('SELECT cells FROM ipo_rows WHERE position >= 0 ORDER BY position')
+            return [json.loads(cells) for (cells,) in cursor]
+
+    def upsert_reports(self, company_name: str, reports: Iterable[dict[str, str]]) -> int:
+        """증권신고서 메타데이터를 저장하고 새로 추가된 보고서 수를 반환합니다."""
+        now = _now()
+        params = [
+            (company_name, r['report_name'], r['date'], r['submitter'], r['company'], now)
+            for r in reports
+        ]
+        with self._lock, self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                """
+                INSERT OR IGNORE INTO dart_reports (company, report_name, date, submitter, filer_company, first_seen)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                params,
+            )
+            return self._conn.total_changes - before
+
+    def load_reports(self, company_name: str, limit: int = 10) -> list[dict[str, str]]:
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                SELECT filer_company, report_name, submitter, date FROM dart_reports
+                WHERE company = ? ORDER BY date DESC LIMIT ?
+                """,
+                (company_name, limit),
+            )
+            return [
+                {'company': filer, 'report_name': name, 'submitter': submitter, 'date': date}
+                for filer, name, submitter, date in cursor
+            ]
+
+    def changes_since(self, since: str) -> dict[str, Any]:
+        """
+        since(ISO 8601 날짜/시각) 부터 새로 생기거나 바뀐 공모주 행과 새 증권신고서를 반환합니다.
+        시간대가 붙은 since 는 저장된 시각과 같은 로컬 시각으로 바꿔 비교하고,
+        first_seen 이 since 이후인 행을 신규('new')로 표시합니다.
+        """
+        parsed = datetime.fromisoformat(since)
+        if parsed.tzinfo is not None:
+            # 저장된 시각은 _now() 의 시간대 없는 로컬 시각이므로 같은 기준으로 맞춥니다.
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        since = parsed.isoformat(timespec='seconds')
+        with self._lock:
+            ipo_rows = [
+                {'cells': json.loads(cells), 'new': first_seen >= since, 'updated_at': updated_at}
+                for cells, first_seen, updated_at in self._conn.execute(
+                    """
+                    SELECT cells, first_seen, updated_at FROM ipo_rows
+                    WHERE updated_at >= ? ORDER BY updated_at DESC, position
+                    """,
+                    (since,),
+                )
+            ]
+            reports = [
+                {'company': company, 'report_name': name, 'submitter': submitter, 'date': date, 'first_seen': first_seen}
+                for company, name, submitter, date, first_seen in self._conn.execute(
+                    """
+                    SELECT company, report_name, submitter, date, first_seen FROM dart_reports
+                    WHERE first_seen >= ? ORDER BY first_seen DESC, date DESC
+                    """,
+                    (since,),
+                )
+            ]
+        return {'since': since, 'ipo_rows': ipo_rows, 'reports': reports}
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,119 @@
+"""
+같은 서버의 도구가 자기 서버의 리소스를 바로 읽기 위한 리졸버 (tutorial_5.py)
+
+ctx.read_resource() 는 리소스 매니저에서 템플릿마다 정규식을 만들어 대조하고, pydantic 으로
+인자를 검증한 뒤 Resource 객체로 감싸 ReadResourceContents 목록을 돌려줍니다.
+LocalResources 는 등록할 때 URI 템플릿을 한 번만 컴파일해 두고, 조회할 때는 핸들러를 바로 호출해
+반환값을 그대로 돌려줍니다. pure=True 로 등록한 리소스는 URI 별 결과를 LRU 로 기억합니다.
+
+등록은 mcp.resource() 로도 함께 하므로 클라이언트에는 기존과 똑같이 보입니다.
+"""
+
+import inspect
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ResourceError
+from pydantic import validate_call
+
+_PARAMETER = re.compile(r'\{(\w+)\}')
+
+
+def compile_uri_template(uri_template: str) -> re.Pattern:
+    """'greeting://{name}' -> ^greeting://(?P<name>[^/]+)$ (FastMCP 의 템플릿 대조 규칙과 같습니다)"""
+    pattern, position = [], 0
+    for match in _PARAMETER.finditer(uri_template):
+        pattern.append(re.escape(uri_template[position:match.start()]))
+        pattern.append(f"(?P<{match.group(1)}>[^/]+)")
+        position = match.end()
+    pattern.append(re.escape(uri_template[position:]))
+    return re.compile(''.join(pattern) + '$')
+
+
+class _Handler:
+    def __init__(self, uri_template: str, fn: Callable[..., Any], pure: bool):
+        self.uri_template = uri_template
+        self.pattern = compile_uri_template(uri_template)
+        self.pure = pure
+        # 모든 인자가 str 이면 URI 에서 꺼낸 값을 그대로 넘기고, 아니면 FastMCP 처럼 형 변환합니다.
+        parameters = inspect.signature(fn).parameters.values()
+        if all(p.annotation in (str, inspect.Parameter.empty) for p in parameters):
+            self.fn = fn
+        else:
+            self.fn = validate_call(fn)
+        self.is_async = inspect.iscoroutinefunction(fn)
+
+
+class LocalResources:
+    def __init__(self, mcp: FastMCP, cache_size: int = 1024):
+        self.mcp = mcp
+        self.cache_size = cache_size
+        self._static: dict[str, _Handler] = {}
+        self._templates: dict[str, list[_Handler]] = {}
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def resource(self, uri_template: str, pure: bool = False, **kwargs) -> Callable:
+        """
+        mcp.resource(uri_template, **kwargs) 와 같이 쓰는 데코레이터입니다.
+        pure=True 는 같은 URI 에 항상 같은 결과를 돌려주는 핸들러에만 지정합니다.
+        """
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            self.mcp.resource(uri_template, **kwargs)(fn)
+            handler = _Handler(uri_template, fn, pure)
+            if _PARAMETER.search(uri_template):
+                # 조회할 때 scheme 이 같은 템플릿만 대조합니다.
+                scheme = uri_template.split('://', 1)[0]
+                self._templates.setdefault(scheme, []).append(handler)
+            else:
+                self._static[uri_template] = handler
+            return fn
+        return decorator
+
+    def _match(self, uri: str) -> tuple[_Handler, dict[str, str]]:
+        handler = self._static.get(uri)
+        if handler is not None:
+            return handler, {}
+        for handler in self._templates.get(uri.split('://', 1)[0], ()):
+            match = handler.pattern.match(uri)
+            if match:
+                return handler, match.groupdict()
+        raise ResourceError(f"Unknown resource: {uri}")
+
+    async def read(self, uri: str) -> Any:
+        """uri 에 해당하는 리소스 핸들러의 반환값(str, bytes 등)을 그대로 반환합니다."""
+        if uri in self._cache:
+            self._cache.move_to_end(uri)
+            self.hits += 1
+            return self._cache[uri]
+
+        handler, params = self._match(uri)
+        self.misses += 1
+        result = handler.fn(**params)
+        if handler.is_async:
+            result = await result
+
+        if handler.pure:
+            self._cache[uri] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self, uri: Optional[str] = None) -> None:
+        """uri 의 기억해 둔 결과를 지웁니다. uri 가 None 이면 모두 지웁니다."""
+        if uri is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(uri, None)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "static": len(self._static),
+            "templates": sum(len(handlers) for handlers in self._templates.values()),
+            "cached": len(self._cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -1,19 +1,123 @@
 from mcp.server.fastmcp import FastMCP
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from datetime import datetime
+from mcp.types import BlobResourceContents, EmbeddedResource, TextContent
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import base64
+import json
 import os
-import requests
-from bs4 import BeautifulSoup
-from typing import Optional
+from typing import Optional, Union
 
-mcp = FastMCP(name="ipo_analyzer")
+from ipo_cache import SingleFlight, TTLCache
+from ipo_http import HTTPClient
+from ipo_index import IPOSearchIndex, normalize
+from ipo_parser import iter_ipo_rows, iter_reports
+from ipo_report import QueueFullError, ReportBlobCache, ReportRenderer, default_report_spill_dir
+from ipo_shared_cache import SharedCache, default_shared_cache_path
+from ipo_store import SnapshotStore, default_store_path
+
+IPO_URL = "https://www.38.co.kr/html/fund/index.htm?o=r"
+DART_SEARCH_URL = "https://dart.fss.or.kr/dsab007/main.do"
+
+# 공모주 목록은 하루에 몇 번만 바뀌므로 파싱한 결과와 검색 인덱스를 TTL 동안 재사용합니다.
+ipo_cache = TTLCache(ttl=float(os.environ.get("IPO_CACHE_TTL", "600")))
+DART_CACHE_TTL = float(os.environ.get("DART_CACHE_TTL", "600"))
+
+# 같은 기업의 증권신고서를 동시에 요청하면 DART 에는 한 번만 요청합니다.
+dart_flight = SingleFlight()
+
+# 같은 컴퓨터의 다른 ipo_analyzer 프로세스들과 스크래핑 결과를 나눠 씁니다.
+# 보고서/이미지 프로세스 풀의 spawn 워커도 이 모듈을 다시 import 하므로
+# SQLite 파일은 import 할 때가 아니라 처음 사용할 때 엽니다.
+@lru_cache(maxsize=1)
+def shared_cache() -> SharedCache:
+    return SharedCache(
+        os.environ.get("IPO_SHARED_CACHE_PATH") or default_shared_cache_path(),
+        max_bytes=int(os.environ.get("IPO_SHARED_CACHE_MAX_BYTES", str(32 * 1024 * 1024))),
+    )
+
+# 두 스크래핑 도구가 연결 풀을 공유합니다.
+http_client = HTTPClient(
+    max_connections=int(os.environ.get("IPO_HTTP_MAX_CONNECTIONS", "20")),
+    max_connections_per_host=int(os.environ.get("IPO_HTTP_MAX_PER_HOST", "4")),
+    connect_timeout=float(os.environ.get("IPO_HTTP_CONNECT_TIMEOUT", "5")),
+    read_timeout=float(os.environ.get("IPO_HTTP_READ_TIMEOUT", "15")),
+    rate_limit_per_host=float(os.environ.get("IPO_HTTP_RATE_PER_HOST", "10")),
+)
+
+# 파싱한 결과를 디스크에 남겨 변경 이력을 조회하고, 재시작 직후에도 바로 응답합니다.
+@lru_cache(maxsize=1)
+def snapshot_store() -> SnapshotStore:
+    return SnapshotStore(os.environ.get("IPO_STORE_PATH") or default_store_path())
+
+# PDF 렌더링은 CPU 작업이므로 프로세스 풀에서 실행합니다. (0이면 CPU 코어 수만큼)
+# inline=True 로 만든 PDF 는 (기업명, 분석 내용) 해시로 캐시하고, 큰 PDF 는 디스크로 내보냅니다.
+# 디스크의 PDF 도 합계 크기와 항목 수 상한을 넘으면 오래된 것부터 지웁니다.
+report_renderer = ReportRenderer(
+    max_workers=int(os.environ.get("IPO_REPORT_WORKERS", "0")) or None,
+    max_pending=int(os.environ.get("IPO_REPORT_MAX_PENDING", "0")) or None,
+    blobs=ReportBlobCache(
+        max_bytes=int(os.environ.get("IPO_REPORT_CACHE_BYTES", str(64 * 1024 * 1024))),
+        spill_threshold=int(os.environ.get("IPO_REPORT_SPILL_BYTES", str(8 * 1024 * 1024))),
+        spill_dir=os.environ.get("IPO_REPORT_SPILL_DIR") or default_report_spill_dir(),
+        max_spill_bytes=int(os.environ.get("IPO_REPORT_SPILL_MAX_BYTES", str(1024 * 1024 * 1024))),
+        max_entries=int(os.environ.get("IPO_REPORT_CACHE_ENTRIES", "1024")),
+    ),
+)
+
+# 보고서 작업(get_report_status)과 inline PDF(ipo-report://)는 이 프로세스의 메모리에만 있으므로
+# HTTP 로 서비스할 때 워커를 여러 개 띄우면 다른 워커로 간 조회가 실패합니다. (serve_http.py 가 확인합니다)
+HTTP_SINGLE_WORKER = "report jobs (get_report_status) and inline PDFs (ipo-report://) are kept in process memory"
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    # 서비스하는 프로세스에서만 SQLite 파일을 엽니다. (이벤트 루프를 막지 않도록 스레드에서)
+    store = await asyncio.to_thread(snapshot_store)
+    await asyncio.to_thread(shared_cache)
+    # 저장된 공모주 목록을 만료된 값으로 채워 두면 첫 호출은 디스크 데이터로 응답하고
+    # 최신 데이터는 백그라운드에서 가져옵니다.
+    rows = await asyncio.to_thread(store.load_ipo_rows)
+    if rows:
+        ipo_cache.set(IPO_URL, await asyncio.to_thread(IPOSearchIndex, rows), stale=True)
+    try:
+        yield
+    finally:
+        await http_client.aclose()
+        report_renderer.shutdown()
+        shared_cache().close()
+        store.close()
+        shared_cache.cache_clear()
+        snapshot_store.cache_clear()
+
+mcp = FastMCP(name="ipo_analyzer", lifespan=lifespan)
+
+def _parse_ipo_rows(content: bytes) -> list[list[str]]:
+    return list(iter_ipo_rows(content))
+
+async def _download_ipo_rows() -> bytes:
+    """
+    38커뮤니케이션 사이트에서 공모주 목록을 가져와 스냅샷 저장소에 기록하고 JSON 으로 반환합니다.
+    """
+    # 페이지가 바뀌지 않았으면 파싱 없이 이전 결과를 그대로 돌려받습니다.
+    rows = await http_client.get_parsed(IPO_URL, _parse_ipo_rows)
+    await asyncio.to_thread(snapshot_store().upsert_ipo_rows, rows)
+    return json.dumps(rows, ensure_ascii=False).encode('utf-8')
+
+@lru_cache(maxsize=1)
+def _build_ipo_index(payload: bytes) -> IPOSearchIndex:
+    # 공유 캐시의 내용이 그대로이면 인덱스를 다시 만들지 않습니다.
+    return IPOSearchIndex(json.loads(payload))
+
+async def _fetch_ipo_index() -> IPOSearchIndex:
+    """
+    공모주 목록을 가져와 검색 인덱스를 만듭니다.
+    다른 프로세스가 이미 가져온 목록이 공유 캐시에 있으면 그것을 사용합니다.
+    """
+    payload = await shared_cache().get_or_fetch(IPO_URL, _download_ipo_rows, ttl=ipo_cache.ttl)
+    return await asyncio.to_thread(_build_ipo_index, payload)
 
 @mcp.tool()
-def get_ipo_data(company_name: Optional[str] = None) -> str:
+async def get_ipo_data(company_name: Optional[str] = None) -> str:
     """
     38커뮤니케이션 사이트에서 공모주 데이터를 가져옵니다.
     
@@ -21,35 +125,12 @@ def get_ipo_data(company_name: Optional[str] = None) -> str:
         company_name: 특정 기업명 (None이면 첫 페이지의 모든 공모주 정보 반환)
     """
     try:
-        url = "https://www.38.co.kr/html/fund/index.htm?o=r"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 공모주 정보가 있는 테이블 찾기
-        tables = soup.find_all('table')
-        ipo_data = []
-        
-        for table in tables:
-            rows = table.find_all('tr')
-            for row in rows:
-                cells = row.find_all(['td', 'th'])
-                if len(cells) >= 3:  # 최소 3개 컬럼이 있는 행만 처리
-                    row_data = [cell.get_text(strip=True) for cell in cells]
-                    if any(keyword in ' '.join(row_data).lower() for keyword in ['기업명', '공모가', '상장일', '공모주']):
-                        ipo_data.append(row_data)
+        ipo_index = await ipo_cache.get_or_load(IPO_URL, _fetch_ipo_index)
+        ipo_data = ipo_index.rows
         
         if company_name:
-            # 특정 기업 검색
-            filtered_data = []
-            for data in ipo_data:
-                if company_name.lower() in ' '.join(data).lower():
-                    filtered_data.append(data)
+            # 특정 기업 검색 (관련도 순)
+            filtered_data = ipo_index.search(company_name)
             
             if filtered_data:
                 result = f"'{company_name}' 관련 공모주 정보:\n\n"
@@ -72,7 +153,87 @@ def get_ipo_data(company_name: Optional[str] = None) -> str:
         return f"데이터를 가져오는 중 오류가 발생했습니다: {str(e)}"
 
 @mcp.tool()
-def get_securities_report(company_name: str) -> str:
+async def get_cache_stats() -> str:
+    """
+    공모주 데이터 캐시(프로세스 내/프로세스 간)의 적중/미스 통계와
+    조건부 요청으로 절약한 전송량/파싱 횟수를 반환합니다.
+    """
+    stats = {
+        "ipo_cache": ipo_cache.stats(),
+        "dart_single_flight": dart_flight.stats(),
+        "http": http_client.stats(),
+        "shared_cache": await asyncio.to_thread(shared_cache().stats),
+        "report_renderer": report_renderer.stats(),
+    }
+    return json.dumps(stats, ensure_ascii=False, indent=2)
+
+REPORT_FOOTER = (
+    "\n※ 상세 내용은 DART 사이트에서 직접 확인하시기 바랍니다.\n"
+    "※ 증권신고서에는 기업의 재무상태, 사업내용, 공모조건 등 상세 정보가 포함되어 있습니다."
+)
+
+def _parse_reports(content: bytes) -> list[dict[str, str]]:
+    return list(iter_reports(content))
+
+async def _download_reports(company_name: str) -> bytes:
+    """
+    DART 공시서류검색 페이지에서 기업의 최근 증권신고서를 가져와 저장하고 JSON 으로 반환합니다.
+    """
+    # 검색 파라미터 설정
+    search_params = {
+        'textCrpCik': company_name,
+        'startDate': '',
+        'endDate': '',
+        'publicType': 'A001',  # 발행공시
+        'reportType': 'A001',  # 증권신고(지분증권)
+        'finalReport': 'recent',
+        'maxResults': '100',
+        'sort': 'date',
+        'series': 'desc'
+    }
+    
+    reports = await http_client.get_parsed(DART_SEARCH_URL, _parse_reports, params=search_params)
+    await asyncio.to_thread(snapshot_store().upsert_reports, company_name, reports)
+    return json.dumps(reports, ensure_ascii=False).encode('utf-8')
+
+def _report_key(company_name: str) -> str:
+    # "카카오뱅크", " 카카오뱅크 " 처럼 표기만 다른 요청을 같은 키로 묶습니다.
+    return f"dart:{normalize(company_name.strip())}"
+
+async def _fetch_reports(company_name: str) -> list[dict[str, str]]:
+    """
+    기업의 최근 증권신고서를 가져옵니다.
+    같은 기업을 동시에 요청하면 한 번만 가져오고, 다른 프로세스가 이미 가져온 결과가
+    공유 캐시에 있으면 그것을 사용합니다.
+    """
+    key = _report_key(company_name)
+    try:
+        payload = await dart_flight.do(
+            key,
+            lambda: shared_cache().get_or_fetch(key, lambda: _download_reports(company_name), ttl=DART_CACHE_TTL),
+        )
+    except Exception:
+        # DART 에 접근할 수 없으면 이전에 저장해 둔 결과로 응답합니다.
+        reports = await asyncio.to_thread(snapshot_store().load_reports, company_name)
+        if not reports:
+            raise
+        return reports
+    
+    return json.loads(payload)
+
+def _format_reports(company_name: str, reports: list[dict[str, str]]) -> str:
+    if not reports:
+        return f"'{company_name}'에 대한 증권신고서를 찾을 수 없습니다."
+    
+    result = f"'{company_name}' 관련 증권신고서 목록:\n\n"
+    for i, report in enumerate(reports, 1):
+        result += f"{i}. {report['report_name']}\n"
+        result += f"   - 제출인: {report['submitter']}\n"
+        result += f"   - 접수일: {report['date']}\n\n"
+    return result
+
+@mcp.tool()
+async def get_securities_report(company_name: str) -> str:
     """
     DART에서 특정 기업의 증권신고서를 검색합니다.
     
@@ -80,67 +241,83 @@ def get_securities_report(company_name: str) -> str:
         company_name: 기업명
     """
     try:
-        # DART 공시서류검색 페이지
-        search_url = "https://dart.fss.or.kr/dsab007/main.do"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        
-        # 검색 파라미터 설정
-        search_params = {
-            'textCrpCik': company_name,
-            'startDate': '',
-            'endDate': '',
-            'publicType': 'A001',  # 발행공시
-            'reportType': 'A001',  # 증권신고(지분증권)
-            'finalReport': 'recent',
-            'maxResults': '100',
-            'sort': 'date',
-            'series': 'desc'
-        }
-        
-        response = requests.get(search_url, params=search_params, headers=headers)
-        response.raise_for_status()
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # 검색 결과 테이블 찾기
-        result_table = soup.find('table', {'class': 'tb_list'})
-        if not result_table:
-            return f"'{company_name}'에 대한 증권신고서를 찾을 수 없습니다."
-        
-        # 결과 파싱
-        rows = result_table.find_all('tr')[1:]  # 헤더 제외
-        reports = []
-        
-        for row in rows[:10]:  # 최근 10개만
-            cells = row.find_all(['td', 'th'])
-            if len(cells) >= 4:
-                report_data = {
-                    'company': cells[1].get_text(strip=True),
-                    'report_name': cells[2].get_text(strip=True),
-                    'submitter': cells[3].get_text(strip=True),
-                    'date': cells[4].get_text(strip=True)
-                }
-                reports.append(report_data)
-        
+        reports = await _fetch_reports(company_name)
+        result = _format_reports(company_name, reports)
         if reports:
-            result = f"'{company_name}' 관련 증권신고서 목록:\n\n"
-            for i, report in enumerate(reports, 1):
-                result += f"{i}. {report['report_name']}\n"
-                result += f"   - 제출인: {report['submitter']}\n"
-                result += f"   - 접수일: {report['date']}\n\n"
-            
-            result += "\n※ 상세 내용은 DART 사이트에서 직접 확인하시기 바랍니다.\n"
-            result += "※ 증권신고서에는 기업의 재무상태, 사업내용, 공모조건 등 상세 정보가 포함되어 있습니다."
-        else:
-            result = f"'{company_name}'에 대한 증권신고서를 찾을 수 없습니다."
-        
+            result += REPORT_FOOTER
         return result
         
     except Exception as e:
         return f"DART에서 데이터를 가져오는 중 오류가 발생했습니다: {str(e)}"
 
+# 여러 기업을 한 번에 조회할 때 동시에 보내는 DART 검색 요청 수
+dart_batch_semaphore = asyncio.Semaphore(int(os.environ.get("DART_BATCH_CONCURRENCY", "8")))
+
+async def _fetch_reports_limited(company_name: str) -> list[dict[str, str]]:
+    async with dart_batch_semaphore:
+        return await _fetch_reports(company_name)
+
+@mcp.tool()
+async def get_securities_reports(company_names: list[str]) -> str:
+    """
+    DART에서 여러 기업의 증권신고서를 동시에 검색합니다.
+    일부 기업의 조회가 실패해도 나머지 결과는 함께 반환합니다.
+    
+    Args:
+        company_names: 기업명 목록
+    """
+    # 같은 기업을 두 번 조회하지 않도록 순서를 유지하며 중복을 제거합니다.
+    names = list(dict.fromkeys(name.strip() for name in company_names if name.strip()))
+    if not names:
+        return "조회할 기업명을 입력해주세요."
+    
+    outcomes = await asyncio.gather(
+        *(_fetch_reports_limited(name) for name in names),
+        return_exceptions=True,
+    )
+    
+    failed = sum(isinstance(outcome, Exception) for outcome in outcomes)
+    result = f"증권신고서 일괄 조회 결과: {len(names)}개 기업 중 {len(names) - failed}건 성공, {failed}건 실패\n\n"
+    for name, outcome in zip(names, outcomes):
+        result += f"=== {name} ===\n"
+        if isinstance(outcome, Exception):
+            result += f"DART에서 데이터를 가져오는 중 오류가 발생했습니다: {str(outcome)}\n\n"
+        else:
+            result += _format_reports(name, outcome) + "\n"
+    
+    result += REPORT_FOOTER
+    return result
+
+@mcp.tool()
+async def get_ipo_changes(since: str) -> str:
+    """
+    저장된 스냅샷에서 특정 시각 이후 새로 생기거나 바뀐 공모주 정보와 새 증권신고서를 조회합니다.
+    
+    Args:
+        since: 기준 시각 (ISO 8601 형식, 예: 2025-10-16 또는 2025-10-16T09:00:00)
+    """
+    try:
+        changes = await asyncio.to_thread(snapshot_store().changes_since, since)
+    except ValueError:
+        return f"'{since}'은(는) 올바른 시각 형식이 아닙니다. 예: 2025-10-16T09:00:00"
+    
+    ipo_rows = changes['ipo_rows']
+    reports = changes['reports']
+    if not ipo_rows and not reports:
+        return f"{changes['since']} 이후 변경된 공모주 정보가 없습니다."
+    
+    result = f"{changes['since']} 이후 변경된 공모주 정보:\n\n"
+    for row in ipo_rows:
+        label = "신규" if row['new'] else "변경"
+        result += f"[{label}] " + " | ".join(row['cells']) + f" ({row['updated_at']})\n"
+    
+    if reports:
+        result += "\n새로 확인된 증권신고서:\n"
+        for report in reports:
+            result += f"- {report['company']}: {report['report_name']} (접수일 {report['date']})\n"
+    
+    return result
+
 @mcp.prompt()
 def analyze_ipo_investment(
     company_name: Optional[str] = None,
@@ -248,126 +425,94 @@ def analyze_ipo_investment(
 분석 결과는 투자자가 이해하기 쉽도록 구조화하여 제시해주세요.
 """
 
-@mcp.tool()
-def generate_ipo_report(
+REPORT_URI = "ipo-report://{digest}"
+
+def _embedded_report(digest: str, pdf: bytes) -> EmbeddedResource:
+    return EmbeddedResource(
+        type="resource",
+        resource=BlobResourceContents(
+            uri=REPORT_URI.format(digest=digest),
+            mimeType="application/pdf",
+            blob=base64.b64encode(pdf).decode('ascii'),
+        ),
+    )
+
+@mcp.tool(structured_output=False)
+async def generate_ipo_report(
     company_name: Optional[str],
     analysis_content: str,
-    output_filename: str = None
-) -> str:
+    output_filename: str = None,
+    wait: bool = True,
+    inline: bool = False
+) -> Union[str, list[Union[TextContent, EmbeddedResource]]]:
     """
     IPO 분석 결과를 PDF 보고서로 생성합니다.
+    렌더링은 별도의 프로세스 풀에서 실행되므로 다른 도구 호출을 막지 않습니다.
     
     Args:
         company_name: 기업명 (None이면 전체 공모주 분석 보고서)
         analysis_content: 분석 내용
         output_filename: 출력 파일명 (선택사항)
+        wait: True면 생성이 끝날 때까지 기다리고, False면 작업 번호를 바로 반환합니다 (get_report_status로 조회)
+        inline: True면 파일을 만들지 않고 PDF 를 응답에 직접 담아 반환합니다 (같은 내용은 다시 렌더링하지 않습니다)
     """
+    if inline:
+        try:
+            stored = await report_renderer.render_bytes(company_name, analysis_content)
+        except QueueFullError as e:
+            return f"{str(e)} 잠시 후 다시 시도해주세요."
+        except Exception as e:
+            return f"PDF 보고서 생성 중 오류가 발생했습니다: {str(e)}"
+        
+        uri = REPORT_URI.format(digest=stored.digest)
+        if stored.data is None:
+            # 응답에 담기에는 큰 PDF 는 디스크에 저장하고 리소스로 따로 읽게 합니다.
+            return f"PDF 보고서가 커서({stored.size:,} bytes) 파일로 저장했습니다: {stored.path} (리소스: {uri})"
+        return [
+            TextContent(type="text", text=f"PDF 보고서가 생성되었습니다. ({stored.size:,} bytes, 리소스: {uri})"),
+            _embedded_report(stored.digest, stored.data),
+        ]
     
-    if not output_filename:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        if company_name:
-            output_filename = f"IPO_Analysis_{company_name}_{timestamp}.pdf"
-        else:
-            output_filename = f"IPO_Market_Analysis_{timestamp}.pdf"
-    
-    # PDF 생성
-    doc = SimpleDocTemplate(output_filename, pagesize=A4)
-    styles = getSampleStyleSheet()
-    story = []
-    
-    # 제목 스타일
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=18,
-        spaceAfter=30,
-        alignment=1,  # 중앙 정렬
-        textColor=colors.darkblue
-    )
-    
-    # 부제목 스타일
-    subtitle_style = ParagraphStyle(
-        'CustomSubtitle',
-        parent=styles['Heading2'],
-        fontSize=14,
-        spaceAfter=12,
-        textColor=colors.darkgreen
-    )
-    
-    # 내용 스타일
-    content_style = ParagraphStyle(
-        'CustomContent',
-        parent=styles['Normal'],
-        fontSize=11,
-        spaceAfter=6,
-        leftIndent=20
-    )
-    
-    # 제목
-    if company_name:
-        story.append(Paragraph(f"공모주 투자 분석 보고서", title_style))
-    else:
-        story.append(Paragraph(f"공모주 시장 분석 보고서", title_style))
-    story.append(Spacer(1, 20))
-    
-    # 기본 정보 테이블
-    basic_info = [
-        ['항목', '내용'],
-        ['분석일자', datetime.now().strftime("%Y년 %m월 %d일")],
-        ['데이터 소스', '38커뮤니케이션 + DART 전자공시시스템'],
-    ]
-    
-    if company_name:
-        basic_info.insert(1, ['기업명', company_name])
-    
-    basic_table = Table(basic_info, colWidths=[2*inch, 4*inch])
-    basic_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    try:
+        job = report_renderer.submit(company_name, analysis_content, output_filename)
+    except QueueFullError as e:
+        return f"{str(e)} 잠시 후 다시 시도해주세요."
     
-    story.append(Paragraph("기본 정보", subtitle_style))
-    story.append(basic_table)
-    story.append(Spacer(1, 20))
+    if not wait:
+        return f"PDF 보고서 생성 작업이 접수되었습니다. 작업 번호: {job.job_id} (출력 파일: {job.output_filename})"
     
-    # 분석 내용
-    if company_name:
-        story.append(Paragraph("투자 분석 결과", subtitle_style))
-    else:
-        story.append(Paragraph("시장 분석 결과", subtitle_style))
-    
-    # 분석 내용을 문단별로 나누어 처리
-    paragraphs = analysis_content.split('\n\n')
-    for para in paragraphs:
-        if para.strip():
-            # 제목인 경우 (## 또는 **로 시작)
-            if para.strip().startswith('**') and para.strip().endswith('**'):
-                title_text = para.strip().replace('**', '')
-                story.append(Paragraph(title_text, subtitle_style))
-            else:
-                story.append(Paragraph(para.strip(), content_style))
-            story.append(Spacer(1, 6))
+    try:
+        await asyncio.shield(job.future)
+    except Exception as e:
+        return f"PDF 보고서 생성 중 오류가 발생했습니다: {str(e)}"
     
-    # 면책조항
-    story.append(Spacer(1, 20))
-    disclaimer = """
-    <b>면책조항:</b><br/>
-    본 보고서는 투자 참고용으로만 사용되어야 하며, 투자 권유가 아닙니다. 
-    투자 결정은 개인의 판단과 책임하에 이루어져야 합니다. 
-    과거 성과가 미래 수익을 보장하지 않으며, 투자에는 원금 손실 위험이 있습니다.
+    return f"PDF 보고서가 성공적으로 생성되었습니다: {job.output_filename}"
+
+@mcp.resource(REPORT_URI, mime_type="application/pdf")
+async def get_report_pdf(digest: str) -> bytes:
+    """generate_ipo_report(inline=True)로 생성한 PDF 보고서"""
+    stored = await asyncio.to_thread(report_renderer.blobs.get, digest)
+    if stored is None:
+        raise ValueError(f"'{digest}' 보고서를 찾을 수 없습니다. generate_ipo_report 를 다시 호출해주세요.")
+    return await asyncio.to_thread(stored.read)
+
+@mcp.tool()
+def get_report_status(job_id: str) -> str:
     """
-    story.append(Paragraph(disclaimer, content_style))
+    generate_ipo_report(wait=False)로 접수한 PDF 보고서 생성 작업의 상태를 조회합니다.
     
-    # PDF 생성
-    doc.build(story)
+    Args:
+        job_id: 작업 번호
+    """
+    job = report_renderer.get(job_id)
+    if job is None:
+        return f"'{job_id}' 작업을 찾을 수 없습니다."
     
-    return f"PDF 보고서가 성공적으로 생성되었습니다: {output_filename}"
+    if job.status == "running":
+        return f"{job.job_id}: 생성 중입니다. (대기/진행 중인 작업 {report_renderer.pending}건)"
+    if job.status == "failed":
+        return f"{job.job_id}: PDF 보고서 생성 중 오류가 발생했습니다: {job.error}"
+    return f"{job.job_id}: PDF 보고서가 성공적으로 생성되었습니다: {job.output_filename}"
 
 if __name__ == "__main__":
     mcp.run()
@@ -1,9 +1,40 @@
-from mcp.server.fastmcp import FastMCP, Image
-from PIL import Image as PILImage
+from mcp.server.fastmcp import FastMCP, Image, Context
+from contextlib import asynccontextmanager
+import json
 import os
-import tempfile
+import time
+from typing import Optional
 
-mcp = FastMCP(name = 'tutorial_4')
+from image_engine import ImageBatchProcessor, ThumbnailEngine, iter_image_paths
+
+# repository root 의 sample-image.jpg (SAMPLE_IMAGE_PATH 로 바꿀 수 있습니다)
+SAMPLE_IMAGE_PATH = os.environ.get("SAMPLE_IMAGE_PATH") or os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "sample-image.jpg"
+)
+
+# 이미지 하나를 디코딩할 때 쓸 수 있는 메모리 상한 (넘으면 나눠 읽거나 거절합니다)
+MAX_DECODE_BYTES = int(os.environ.get("IMAGE_MAX_DECODE_MB", "256")) * 1024 * 1024
+
+thumbnail_engine = ThumbnailEngine(max_decode_bytes=MAX_DECODE_BYTES)
+
+# 이미지 일괄 처리는 CPU 작업이므로 프로세스 풀에서 실행합니다. (0이면 CPU 코어 수만큼)
+batch_processor = ImageBatchProcessor(
+    max_workers=int(os.environ.get("IMAGE_WORKERS", "0")) or None,
+    max_files=int(os.environ.get("IMAGE_MAX_FILES", "10000")),
+    max_decode_bytes=MAX_DECODE_BYTES,
+)
+
+# 진행 상황 알림은 이 간격(초)보다 자주 보내지 않습니다.
+PROGRESS_INTERVAL = 0.25
+
+@asynccontextmanager
+async def lifespan(server: FastMCP):
+    try:
+        yield
+    finally:
+        batch_processor.shutdown()
+
+mcp = FastMCP(name = 'tutorial_4', lifespan=lifespan)
 
 @mcp.tool()
 def create_thumbnail() -> Image:
@@ -11,17 +42,62 @@ def create_thumbnail() -> Image:
     Create a thumbnail image.
     '''
     try:
-        img_path = "/Users/auaicn/projects/mcp-server-practice/sample-image.jpg"
-        img = PILImage.open(img_path)
-        img.thumbnail((100, 100))
-
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            img.save(tmp, format="png")
-            tmp_path = tmp.name
-
-        return Image(tmp_path, format="png")
+        data = thumbnail_engine.thumbnail(SAMPLE_IMAGE_PATH, (100, 100), format="png")
+        return Image(data=data, format="png")
     except Exception as e:
         return f"Error creating thumbnail: {e}"
 
+@mcp.tool()
+async def process_images(
+    source: str,
+    ctx: Context,
+    sizes: Optional[list[int]] = None,
+    format: str = "png",
+    output_dir: Optional[str] = None,
+) -> str:
+    '''
+    Resize every image in a directory or glob pattern (e.g. "photos/**/*.jpg") to each of
+    the given sizes (longest edge, in pixels, default [100]) and save them as png, jpeg or webp.
+    Returns a JSON summary with per-file results. Output defaults to "<source dir>/thumbnails".
+    '''
+    if sizes is None:
+        sizes = [100]
+    paths = list(iter_image_paths(source))
+    if not paths:
+        return f"No images found for: {source}"
+    if output_dir is None:
+        base = source if os.path.isdir(source) else os.path.commonpath([os.path.dirname(path) for path in paths])
+        output_dir = os.path.join(base, "thumbnails")
+    # 이전 실행의 결과물이 다시 입력으로 잡히지 않도록 출력 디렉터리는 제외합니다.
+    output_prefix = os.path.join(os.path.abspath(output_dir), "")
+    paths = [path for path in paths if not os.path.abspath(path).startswith(output_prefix)]
+
+    started = time.perf_counter()
+    last_report = 0.0
+
+    async def on_progress(done: int, total: int, result: dict) -> None:
+        nonlocal last_report
+        now = time.perf_counter()
+        if done == total or now - last_report >= PROGRESS_INTERVAL:
+            last_report = now
+            await ctx.report_progress(done, total, f"{os.path.basename(result['source'])} ({done}/{total})")
+
+    try:
+        results = await batch_processor.run(paths, sizes, format, output_dir, on_progress)
+    except ValueError as e:
+        return f"Error processing images: {e}"
+
+    failed = sum(1 for result in results if "error" in result)
+    summary = {
+        "source": source,
+        "output_dir": output_dir,
+        "files": len(results),
+        "succeeded": len(results) - failed,
+        "failed": failed,
+        "elapsed_s": round(time.perf_counter() - started, 2),
+        "results": results,
+    }
+    return json.dumps(summary, ensure_ascii=False)
+
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    mcp.run()
@@ -1,7 +1,9 @@
-from mcp.server.fastmcp import FastMCP, Context
+from mcp.server.fastmcp import FastMCP
 import logging
 import sys
 
+from local_resources import LocalResources
+
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -12,33 +14,24 @@ logger = logging.getLogger(__name__)
 
 mcp = FastMCP(name = 'tutorial_5')
 
+# 도구에서 이 서버의 리소스를 MCP 리소스 경로를 거치지 않고 바로 읽습니다.
+resources = LocalResources(mcp)
+
 @mcp.tool()
-async def greeting(name: str, ctx: Context) -> str:
+async def greeting(name: str) -> str:
     """Get a greeting using the greeting resource."""
     try:
-        result = await ctx.read_resource(f"greeting://{name}")
-        logger.debug(f"Result type: {type(result)}")
-        logger.debug(f"Result: {result}")
-
-        content = None
-
-        if isinstance(result, list):
-            content = result[0].content
-        else:
-            content = result.content
-        
-        if content is None:
-            return f"Error getting greeting: {result}"
-        
+        content = await resources.read(f"greeting://{name}")
+        logger.debug(f"Result: {content}")
         return f"Tool Response : {content}"
     except Exception as e:
         return f"Error getting greeting: {e}"
 
 
-@mcp.resource('greeting://{name}')
+@resources.resource('greeting://{name}', pure=True)
 def get_greeting(name: str) -> str:
     """Get a greeting using the greeting resource."""
     return f"Hello, {name}!"
 
 if __name__ == "__main__":
-    mcp.run()
\ No newline at end of file
+    mcp.run()
@@ -6,8 +6,9 @@ A simple weather information server demonstrating core MCP concepts
 
 import asyncio
 import json
+import os
 from typing import Any
-from mcp.server import Server
+from mcp.server import NotificationOptions, Server
 from mcp.types import (
     Tool,
     TextContent,
@@ -17,12 +18,25 @@ from mcp.types import (
     Prompt,
     PromptMessage,
     GetPromptResult,
+    ReadResourceRequest,
+    ReadResourceResult,
+    ServerResult,
 )
 from mcp.server.stdio import stdio_server
 
+from catalog import Catalog, ListChangedNotifier
+from payload_cache import PayloadCache
+from tool_registry import ToolRegistry, ToolResult
+from uri_router import URIRouter
+from weather_store import WeatherStore
+
 # Initialize MCP server
 app = Server("weather-server")
 
+# Sessions that listed tools/resources/prompts get a list_changed notification
+# when a catalog changes
+notifier = ListChangedNotifier(app)
+
 # Sample data for demonstration
 WEATHER_DATA = {
     "seoul": {"temp": 18, "condition": "Cloudy", "humidity": 65},
@@ -30,147 +44,293 @@ WEATHER_DATA = {
     "london": {"temp": 12, "condition": "Rainy", "humidity": 80},
 }
 
-# 1. List available tools
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """Return list of available tools"""
-    return [
-        Tool(
-            name="get_weather",
-            description="Get current weather information for a city",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name (e.g., seoul, tokyo, london)",
-                    }
-                },
-                "required": ["city"],
+# Station data lives in a columnar store. Set WEATHER_STORE_PATH to a .csv file
+# (city,temp,humidity,condition) or a directory written by WeatherStore.save()
+# to serve more stations than the samples above.
+WEATHER_STORE_PATH = os.environ.get("WEATHER_STORE_PATH")
+store = WeatherStore.open(WEATHER_STORE_PATH) if WEATHER_STORE_PATH else WeatherStore.from_records(WEATHER_DATA)
+
+# Cities listed in "not available" messages
+MAX_LISTED_CITIES = 10
+
+
+def available_cities() -> str:
+    names = store.names[:MAX_LISTED_CITIES]
+    more = len(store) - len(names)
+    return ", ".join(names) + (f" and {more:,} more" if more > 0 else "")
+
+
+# 1. Register tools
+tools = ToolRegistry()
+notifier.attach(tools.catalog, "tools")
+
+
+@tools.tool(
+    name="get_weather",
+    description="Get current weather information for a city",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name (e.g., seoul, tokyo, london)",
+            }
+        },
+        "required": ["city"],
+    },
+)
+async def get_weather(city: str) -> list[TextContent]:
+    city = city.lower()
+    weather = store.lookup(city)
+    
+    if weather is None:
+        return [
+            TextContent(
+                type="text",
+                text=f"Weather data not available for {city}. Available cities: {available_cities()}"
+            )
+        ]
+    
+    result = f"Weather in {city.title()}:\n"
+    result += f"Temperature: {weather['temp']}°C\n"
+    result += f"Condition: {weather['condition']}\n"
+    result += f"Humidity: {weather['humidity']}%"
+    
+    return [TextContent(type="text", text=result)]
+
+
+@tools.tool(
+    name="get_forecast",
+    description="Get 3-day weather forecast for a city",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "city": {
+                "type": "string",
+                "description": "City name",
             },
-        ),
-        Tool(
-            name="get_forecast",
-            description="Get 3-day weather forecast for a city",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name",
-                    },
-                    "days": {
-                        "type": "number",
-                        "description": "Number of days (1-3)",
-                        "default": 3,
-                    }
-                },
-                "required": ["city"],
+            "days": {
+                "type": "integer",
+                "description": "Number of days (1-3)",
+                "minimum": 1,
+                "default": 3,
+            }
+        },
+        "required": ["city"],
+    },
+)
+async def get_forecast(city: str, days: int = 3) -> list[TextContent]:
+    city = city.lower()
+    days = min(int(days), 3)
+    row = store.row(city)
+    
+    if row is None:
+        return [
+            TextContent(
+                type="text",
+                text=f"Forecast data not available for {city}"
+            )
+        ]
+    
+    condition = store.conditions[store.condition.item(row)]
+    temps = store.forecast([row], days)[0]
+    result = f"{days}-day forecast for {city.title()}:\n"
+    result += "".join(f"Day {day}: {condition}, {temp:g}°C\n" for day, temp in enumerate(temps.tolist(), 1))
+    
+    return [TextContent(type="text", text=result)]
+
+
+# Batch variants: one round trip for many cities. Results come back in
+# request order as structuredContent (plus the same JSON, compact, as text);
+# unknown cities get an "error" entry instead of failing the whole call.
+MAX_BATCH_CITIES = 1000
+
+CITIES_SCHEMA = {
+    "type": "array",
+    "description": "City names",
+    "items": {"type": "string"},
+    "minItems": 1,
+    "maxItems": MAX_BATCH_CITIES,
+}
+
+
+def batch_result(results: list[dict[str, Any]]) -> ToolResult:
+    errors = sum("error" in item for item in results)
+    structured = {"results": results, "found": len(results) - errors, "errors": errors}
+    text = json.dumps(structured, ensure_ascii=False, separators=(",", ":"))
+    return [TextContent(type="text", text=text)], structured
+
+
+@tools.tool(
+    name="get_weather_batch",
+    description="Get current weather for many cities in one call",
+    input_schema={
+        "type": "object",
+        "properties": {"cities": CITIES_SCHEMA},
+        "required": ["cities"],
+    },
+)
+async def get_weather_batch(cities: list[str]) -> ToolResult:
+    rows = store.rows(cities)
+    found = iter(store.records(rows[rows >= 0]))
+    results = [
+        {"city": city.lower(), **next(found)} if row >= 0
+        else {"city": city.lower(), "error": "Weather data not available"}
+        for city, row in zip(cities, rows.tolist())
+    ]
+    return batch_result(results)
+
+
+@tools.tool(
+    name="get_forecast_batch",
+    description="Get weather forecasts (up to 3 days) for many cities in one call",
+    input_schema={
+        "type": "object",
+        "properties": {
+            "cities": CITIES_SCHEMA,
+            "days": {
+                "type": "integer",
+                "description": "Number of days (1-3)",
+                "minimum": 1,
+                "default": 3,
             },
-        ),
+        },
+        "required": ["cities"],
+    },
+)
+async def get_forecast_batch(cities: list[str], days: int = 3) -> ToolResult:
+    days = min(int(days), 3)
+    rows = store.rows(cities)
+    known = rows[rows >= 0]
+    # One (len(known), days) array for every requested city
+    temps = iter(store.forecast_lists(known, days))
+    conditions = iter(store.condition[known].tolist())
+    results = [
+        {"city": city.lower(), "condition": store.conditions[next(conditions)], "temps": next(temps)} if row >= 0
+        else {"city": city.lower(), "error": "Forecast data not available"}
+        for city, row in zip(cities, rows.tolist())
     ]
+    return batch_result(results)
+
+
+# 2. List available tools and handle tool calls
+@app.list_tools()
+async def list_tools() -> list[Tool]:
+    """Return list of available tools"""
+    notifier.track("tools")
+    return tools.list_tools()
 
 
-# 2. Handle tool calls
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
+# Arguments are validated by the registry's precompiled validators
+@app.call_tool(validate_input=False)
+async def call_tool(name: str, arguments: Any) -> ToolResult:
     """Execute tool based on name"""
-    
-    if name == "get_weather":
-        city = arguments.get("city", "").lower()
-        
-        if city not in WEATHER_DATA:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Weather data not available for {city}. Available cities: {', '.join(WEATHER_DATA.keys())}"
-                )
-            ]
-        
-        weather = WEATHER_DATA[city]
-        result = f"Weather in {city.title()}:\n"
-        result += f"Temperature: {weather['temp']}°C\n"
-        result += f"Condition: {weather['condition']}\n"
-        result += f"Humidity: {weather['humidity']}%"
-        
-        return [TextContent(type="text", text=result)]
-    
-    elif name == "get_forecast":
-        city = arguments.get("city", "").lower()
-        days = min(arguments.get("days", 3), 3)
-        
-        if city not in WEATHER_DATA:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Forecast data not available for {city}"
-                )
-            ]
-        
-        result = f"{days}-day forecast for {city.title()}:\n"
-        for day in range(1, days + 1):
-            result += f"Day {day}: {WEATHER_DATA[city]['condition']}, "
-            result += f"{WEATHER_DATA[city]['temp'] + day}°C\n"
-        
-        return [TextContent(type="text", text=result)]
-    
-    raise ValueError(f"Unknown tool: {name}")
+    return await tools.call(name, arguments)
 
 
 # 3. List available resources
+resource_catalog: Catalog[Resource] = Catalog()
+notifier.attach(resource_catalog, "resources")
+
+resource_catalog.add(
+    "weather://cities",
+    Resource(
+        uri="weather://cities",
+        name="Available Cities",
+        mimeType="application/json",
+        description="List of cities with weather data",
+    ),
+)
+resource_catalog.add(
+    "weather://city/seoul",
+    Resource(
+        uri=f"weather://city/seoul",
+        name="Seoul Weather",
+        mimeType="application/json",
+        description="Current weather data for Seoul",
+    ),
+)
+
+
 @app.list_resources()
 async def list_resources() -> list[Resource]:
     """Return list of available resources"""
-    return [
-        Resource(
-            uri="weather://cities",
-            name="Available Cities",
-            mimeType="application/json",
-            description="List of cities with weather data",
-        ),
-        Resource(
-            uri=f"weather://city/seoul",
-            name="Seoul Weather",
-            mimeType="application/json",
-            description="Current weather data for Seoul",
-        ),
-    ]
+    notifier.track("resources")
+    return resource_catalog.list()
 
 
 # 4. Read resource content
-@app.read_resource()
-async def read_resource(uri: str) -> str:
+resources = URIRouter()
+
+
+@resources.route("weather://cities")
+def read_cities() -> list[str]:
+    return store.names
+
+
+@resources.route("weather://city/{city}")
+def read_city(city: str) -> dict[str, Any]:
+    weather = store.lookup(city)
+    if weather is not None:
+        return weather
+    raise ValueError(f"City not found: {city}")
+
+
+# Resource contents are serialized once per URI (compact JSON + content hash
+# in _meta) and reused until the station data changes
+payloads = PayloadCache(max_entries=int(os.environ.get("WEATHER_PAYLOAD_CACHE_SIZE", "4096")))
+
+
+def replace_store(new_store: WeatherStore) -> None:
+    """Serve new station data and drop payloads built from the old store"""
+    global store
+    store = new_store
+    payloads.invalidate()
+
+
+async def read_resource(req: ReadResourceRequest) -> ServerResult:
     """Return resource content based on URI"""
     
-    if uri == "weather://cities":
-        return json.dumps(list(WEATHER_DATA.keys()), indent=2)
+    uri = str(req.params.uri)
+    match = resources.match(uri)
+    if match is None:
+        raise ValueError(f"Unknown resource: {uri}")
     
-    if uri.startswith("weather://city/"):
-        city = uri.split("/")[-1].lower()
-        if city in WEATHER_DATA:
-            return json.dumps(WEATHER_DATA[city], indent=2)
-        raise ValueError(f"City not found: {city}")
-    
-    raise ValueError(f"Unknown resource: {uri}")
+    handler, params = match
+    payload = payloads.get(uri, lambda: handler(**params))
+    return ServerResult(ReadResourceResult(contents=[payload.contents]))
+
+
+# Registered as a raw request handler: @app.read_resource() rebuilds the
+# contents model on every read and has no way to attach _meta
+app.request_handlers[ReadResourceRequest] = read_resource
 
 
 # 5. List available prompts
+prompt_catalog: Catalog[Prompt] = Catalog()
+notifier.attach(prompt_catalog, "prompts")
+
+prompt_catalog.add(
+    "weather_report",
+    Prompt(
+        name="weather_report",
+        description="Generate a weather report for a city",
+        arguments=[
+            {
+                "name": "city",
+                "description": "City name",
+                "required": True,
+            }
+        ],
+    ),
+)
+
+
 @app.list_prompts()
 async def list_prompts() -> list[Prompt]:
     """Return list of available prompt templates"""
-    return [
-        Prompt(
-            name="weather_report",
-            description="Generate a weather report for a city",
-            arguments=[
-                {
-                    "name": "city",
-                    "description": "City name",
-                    "required": True,
-                }
-            ],
-        )
-    ]
+    notifier.track("prompts")
+    return prompt_catalog.list()
 
 
 # 6. Get prompt content
@@ -204,7 +364,13 @@ async def main():
         await app.run(
             read_stream,
             write_stream,
-            app.create_initialization_options()
+            app.create_initialization_options(
+                notification_options=NotificationOptions(
+                    prompts_changed=True,
+                    resources_changed=True,
+                    tools_changed=True,
+                )
+            )
         )
 
 
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Batch tool benchmark
+Weather for N cities through an in-memory client session
+(basic_mcp_server.py, full JSON-RPC path):
+
+- sequential : N get_weather calls, one after another
+- concurrent : N get_weather calls in flight at once
+- batch      : one get_weather_batch call
+
+The same comparison is run for get_forecast / get_forecast_batch.
+
+    python benchmarks/bench_batch_tools.py --cities 200 --stations 100000
+"""
+
+import argparse
+import asyncio
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp.shared.memory import create_connected_server_and_client_session
+
+
+def write_stations(path: str, count: int, rng: random.Random) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["city", "temp", "humidity", "condition"])
+        for i in range(count):
+            writer.writerow([f"station{i}", rng.randint(-20, 40), rng.randint(10, 100), rng.choice(["Sunny", "Cloudy", "Rainy"])])
+
+
+async def measure(label: str, run, cities: int, rounds: int) -> None:
+    await run()  # warm up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await run()
+    elapsed = (time.perf_counter() - start) / rounds
+    print(f"  {label:<12} {elapsed * 1000:>9.2f} ms/refresh   {cities / elapsed:>10,.0f} cities/s")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cities", type=int, default=200, help="cities per dashboard refresh")
+    parser.add_argument("--stations", type=int, default=100_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        # The server reads its station data at import time
+        os.environ["WEATHER_STORE_PATH"] = os.path.join(tmp, "stations.csv")
+        write_stations(os.environ["WEATHER_STORE_PATH"], args.stations, rng)
+        import basic_mcp_server
+
+    cities = [f"station{rng.randrange(args.stations)}" for _ in range(args.cities)]
+    async with create_connected_server_and_client_session(basic_mcp_server.app) as client:
+        for tool, batch_tool, extra in (
+            ("get_weather", "get_weather_batch", {}),
+            ("get_forecast", "get_forecast_batch", {"days": 3}),
+        ):
+            print(f"{tool} x {len(cities)} cities")
+
+            async def sequential():
+                for city in cities:
+                    await client.call_tool(tool, {"city": city, **extra})
+
+            async def concurrent():
+                await asyncio.gather(*(client.call_tool(tool, {"city": city, **extra}) for city in cities))
+
+            async def batch():
+                result = await client.call_tool(batch_tool, {"cities": cities, **extra})
+                assert result.structuredContent["found"] == len(cities)
+
+            await measure("sequential", sequential, len(cities), args.rounds)
+            await measure("concurrent", concurrent, len(cities), args.rounds)
+            await measure("batch", batch, len(cities), args.rounds)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Resource serialization benchmark
+Cost and size of the payload for weather://cities and weather://city/{name}:
+
+- indent=2 : json.dumps(..., indent=2) on every read (the old read_resource)
+- compact  : compact json.dumps on every read
+- orjson   : orjson.dumps on every read (skipped if orjson is not installed)
+- cached   : PayloadCache.get(), serialized and hashed once per URI
+
+    python benchmarks/bench_payload_cache.py --stations 100000
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from payload_cache import PayloadCache, dumps, orjson
+from weather_store import WeatherStore
+
+
+def make_store(count: int, rng: random.Random) -> WeatherStore:
+    return WeatherStore.from_records({
+        f"station{i}": {"temp": rng.randint(-20, 40), "condition": rng.choice(["Sunny", "Cloudy", "Rainy"]), "humidity": rng.randint(10, 100)}
+        for i in range(count)
+    })
+
+
+def measure(label: str, serialize, reads: int) -> None:
+    size = len(serialize())
+    start = time.perf_counter()
+    for _ in range(reads):
+        serialize()
+    elapsed = (time.perf_counter() - start) / reads
+    print(f"  {label:<10} {elapsed * 1e6:>12.2f} us/read   {size:>12,} bytes")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stations", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=2000)
+    args = parser.parse_args()
+
+    store = make_store(args.stations, random.Random(0))
+    cache = PayloadCache()
+    for uri, build, reads in (
+        ("weather://cities", lambda: store.names, max(args.reads // 100, 5)),
+        ("weather://city/station42", lambda: store.lookup("station42"), args.reads),
+    ):
+        print(f"{uri} ({reads} reads)")
+        measure("indent=2", lambda: json.dumps(build(), indent=2).encode(), reads)
+        measure("compact", lambda: json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode(), reads)
+        if orjson is not None:
+            measure("orjson", lambda: dumps(build()), reads)
+        measure("cached", lambda: cache.get(uri, build).data, reads)
+
+
+if __name__ == "__main__":
+    main()
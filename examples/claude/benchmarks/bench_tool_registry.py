@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Tool dispatch benchmark
+Calls per second with many registered tools:
+
+- if/elif + validate : scan tool names in order and run jsonschema.validate()
+                       per call (what the low-level Server does with
+                       validate_input=True)
+- registry           : ToolRegistry dict lookup + precompiled validator
+
+    python benchmarks/bench_tool_registry.py --tools 10 100 1000
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+
+import jsonschema
+from mcp.types import TextContent
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tool_registry import ToolRegistry
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "city": {"type": "string"},
+        "days": {"type": "integer", "minimum": 1, "default": 3},
+        "units": {"type": "string", "enum": ["metric", "imperial"]},
+    },
+    "required": ["city"],
+}
+
+RESULT = [TextContent(type="text", text="ok")]
+
+
+async def handler(city: str, days: int = 3, units: str = "metric") -> list[TextContent]:
+    return RESULT
+
+
+def build(count: int) -> tuple[ToolRegistry, list[tuple[str, dict]]]:
+    registry = ToolRegistry()
+    for i in range(count):
+        registry.tool(name=f"tool_{i}", description=f"Tool {i}", input_schema=SCHEMA)(handler)
+    return registry, [(f"tool_{i}", SCHEMA) for i in range(count)]
+
+
+async def chain_call(chain: list[tuple[str, dict]], name: str, arguments: dict) -> list[TextContent]:
+    for tool_name, schema in chain:
+        if tool_name == name:
+            jsonschema.validate(instance=arguments, schema=schema)
+            return await handler(**arguments)
+    raise ValueError(f"Unknown tool: {name}")
+
+
+async def measure(label: str, call, calls: list[tuple[str, dict]]) -> None:
+    start = time.perf_counter()
+    for name, arguments in calls:
+        await call(name, arguments)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<20} {len(calls) / elapsed:>12,.0f} calls/s   {elapsed / len(calls) * 1e6:>8.2f} us/call")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tools", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for count in args.tools:
+        start = time.perf_counter()
+        registry, chain = build(count)
+        print(f"{count} tools (registry build {(time.perf_counter() - start) * 1000:.1f} ms)")
+        calls = [
+            (f"tool_{rng.randrange(count)}", {"city": "seoul", "days": rng.randint(1, 3), "units": "metric"})
+            for _ in range(args.calls)
+        ]
+        await measure("if/elif + validate", lambda name, arguments: chain_call(chain, name, arguments), calls[:1000])
+        await measure("registry", registry.call, calls)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
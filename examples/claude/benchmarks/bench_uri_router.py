@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+URI router benchmark
+Compares URIRouter with a linear scan over per-template regexes (how
+FastMCP's resource manager and the old if/startswith chain scale) for
+1k and 10k registered templates.
+
+    python benchmarks/bench_uri_router.py --templates 1000 10000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from uri_router import URIRouter
+
+
+def make_templates(count: int) -> list[str]:
+    """A mix of shapes: per-service schemes, deep paths and shared prefixes"""
+    templates = []
+    for i in range(count):
+        shape = i % 4
+        if shape == 0:
+            templates.append(f"svc{i}://items/{{item_id}}")
+        elif shape == 1:
+            templates.append(f"api://v1/resource{i}/{{id}}/detail")
+        elif shape == 2:
+            templates.append(f"api://v1/resource{i}/{{id}}/history/{{page}}")
+        else:
+            templates.append(f"files://bucket{i}/{{name}}")
+    return templates
+
+
+def sample_uri(template: str) -> str:
+    return re.sub(r"\{\w+\}", "x42", template)
+
+
+class LinearMatcher:
+    def __init__(self, templates: list[str]):
+        self.patterns = [
+            (re.compile("^" + template.replace("{", "(?P<").replace("}", ">[^/]+)") + "$"), template)
+            for template in templates
+        ]
+
+    def match(self, uri: str):
+        for pattern, template in self.patterns:
+            found = pattern.match(uri)
+            if found:
+                return template, found.groupdict()
+        return None
+
+
+def measure(label: str, match, uris: list[str]) -> None:
+    start = time.perf_counter()
+    for uri in uris:
+        if match(uri) is None:
+            raise AssertionError(f"no match for {uri}")
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<8} {elapsed / len(uris) * 1e6:>10.2f} us/lookup")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--templates", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for count in args.templates:
+        templates = make_templates(count)
+        uris = [sample_uri(rng.choice(templates)) for _ in range(args.lookups)]
+
+        start = time.perf_counter()
+        router = URIRouter()
+        for template in templates:
+            router.add(template, template)
+        build = time.perf_counter() - start
+        linear = LinearMatcher(templates)
+
+        print(f"{count} templates (router build {build * 1000:.1f} ms)")
+        # the linear scan is slow at 10k templates, so it gets fewer lookups
+        measure("linear", linear.match, uris[:200])
+        measure("router", router.match, uris)
+
+
+if __name__ == "__main__":
+    main()
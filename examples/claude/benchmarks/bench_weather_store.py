@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Weather store benchmark
+Dict-of-dicts station data (WEATHER_DATA in basic_mcp_server.py) vs the
+columnar WeatherStore at 100k stations:
+
+- load     : parse a CSV vs open a saved store with memory-mapped arrays
+- lookup   : current weather for random cities
+- forecast : N-day temperatures for a batch of cities, Python loop vs one
+             vectorized operation
+
+    python benchmarks/bench_weather_store.py --stations 100000 --days 3
+"""
+
+import argparse
+import csv
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from weather_store import WeatherStore
+
+CONDITIONS = ["Sunny", "Cloudy", "Rainy", "Snowy", "Windy"]
+
+
+def write_csv(path: str, count: int, rng: random.Random) -> None:
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["city", "temp", "humidity", "condition"])
+        for i in range(count):
+            writer.writerow([f"station{i}", rng.randint(-20, 40), rng.randint(10, 100), rng.choice(CONDITIONS)])
+
+
+def load_dicts(path: str) -> dict[str, dict]:
+    with open(path, newline="", encoding="utf-8") as f:
+        return {
+            row["city"].lower(): {"temp": float(row["temp"]), "condition": row["condition"], "humidity": float(row["humidity"])}
+            for row in csv.DictReader(f)
+        }
+
+
+def timed(label: str, func, count: int, unit: str):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<22} {elapsed * 1000:>10.2f} ms   {count / elapsed:>14,.0f} {unit}/s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stations", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=100_000)
+    parser.add_argument("--batch", type=int, default=10_000, help="cities per forecast batch")
+    parser.add_argument("--days", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "stations.csv")
+        write_csv(csv_path, args.stations, rng)
+        WeatherStore.from_csv(csv_path).save(os.path.join(tmp, "store"))
+
+        print(f"load ({args.stations:,} stations)")
+        data = timed("csv -> dict of dicts", lambda: load_dicts(csv_path), args.stations, "stations")
+        timed("csv -> WeatherStore", lambda: WeatherStore.from_csv(csv_path), args.stations, "stations")
+        store = timed("mmap WeatherStore", lambda: WeatherStore.load(os.path.join(tmp, "store")), args.stations, "stations")
+
+        cities = [f"Station{rng.randrange(args.stations)}" for _ in range(args.lookups)]
+        print(f"lookup ({args.lookups:,} cities)")
+        timed("dict of dicts", lambda: [data[city.lower()] for city in cities], len(cities), "lookups")
+        timed("store.lookup", lambda: [store.lookup(city) for city in cities], len(cities), "lookups")
+        timed("store.rows (batch)", lambda: store.rows(cities), len(cities), "lookups")
+
+        batch = cities[: args.batch]
+        days = args.days
+        print(f"forecast ({len(batch):,} cities x {days} days)")
+
+        def loop_forecast():
+            return [[data[city.lower()]["temp"] + day for day in range(1, days + 1)] for city in batch]
+
+        expected = timed("python loop", loop_forecast, len(batch), "cities")
+        rows = store.rows(batch)
+        temps = timed("vectorized", lambda: store.forecast(rows, days), len(batch), "cities")
+        assert temps.tolist() == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Catalogs
+Tool/resource/prompt listings that are built once per version, and
+listChanged notifications for the sessions that have read them
+"""
+
+import asyncio
+import logging
+import weakref
+from typing import Callable, Generic, Optional, TypeVar
+
+from mcp.server import Server
+from mcp.server.session import ServerSession
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Catalog(Generic[T]):
+    """
+    Named items kept in registration order.
+
+    list() returns the same list object until an item is added or removed,
+    so list handlers stop rebuilding pydantic models on every call. Callers
+    must not modify the returned list. Every change bumps version and runs
+    the on_change callbacks.
+    """
+
+    def __init__(self):
+        self._items: dict[str, T] = {}
+        self._listing: Optional[list[T]] = None
+        self._callbacks: list[Callable[[], None]] = []
+        self.version = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._items
+
+    def get(self, name: str) -> Optional[T]:
+        return self._items.get(name)
+
+    def add(self, name: str, item: T) -> None:
+        if self._items.get(name) == item:
+            return
+        self._items[name] = item
+        self._changed()
+
+    def remove(self, name: str) -> None:
+        if self._items.pop(name, None) is not None:
+            self._changed()
+
+    def list(self) -> list[T]:
+        if self._listing is None:
+            self._listing = list(self._items.values())
+        return self._listing
+
+    def on_change(self, callback: Callable[[], None]) -> None:
+        self._callbacks.append(callback)
+
+    def _changed(self) -> None:
+        self._listing = None
+        self.version += 1
+        for callback in self._callbacks:
+            callback()
+
+
+class ListChangedNotifier:
+    """
+    Remember the sessions that listed a catalog and send them a
+    notifications/*/list_changed message when that catalog changes.
+
+    Call track() from the list handlers. Sessions are held weakly, so closed
+    sessions drop out on their own.
+    """
+
+    _SENDERS = {
+        "tools": ServerSession.send_tool_list_changed,
+        "resources": ServerSession.send_resource_list_changed,
+        "prompts": ServerSession.send_prompt_list_changed,
+    }
+
+    def __init__(self, app: Server):
+        self.app = app
+        self._sessions: dict[str, weakref.WeakSet] = {kind: weakref.WeakSet() for kind in self._SENDERS}
+        self._tasks: set[asyncio.Task] = set()
+        self.sent = 0
+
+    def track(self, kind: str) -> None:
+        self._sessions[kind].add(self.app.request_context.session)
+
+    def attach(self, catalog: Catalog, kind: str) -> None:
+        catalog.on_change(lambda: self.notify(kind))
+
+    def notify(self, kind: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Registered at import time: no session can have listed anything yet
+            return
+        for session in list(self._sessions[kind]):
+            task = loop.create_task(self._send(session, kind))
+            # Keep a reference until the notification is sent
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, session: ServerSession, kind: str) -> None:
+        try:
+            await self._SENDERS[kind](session)
+            self.sent += 1
+        except Exception:
+            logger.debug("Dropping session after failed %s list_changed notification", kind, exc_info=True)
+            self._sessions[kind].discard(session)
@@ -1,212 +1,273 @@
 #!/usr/bin/env python3
 """
-Basic MCP Server Example
-A simple weather information server demonstrating core MCP concepts
+MCP Client Load Generator
+Drive an MCP server over stdio or streamable HTTP with concurrent
+call_tool / read_resource / get_prompt requests and report throughput,
+latency percentiles and errors as JSON
+
+    python client_example.py basic_mcp_server.py --requests 5000 --concurrency 32
+    python client_example.py ../book/tutorial_1.py --op 'tool:echo:{"message": "hi"}'
+    python client_example.py --url http://127.0.0.1:8000/mcp --sessions 8 --rate 500 --duration 30
+
+Operations are given as
+    tool:NAME[:JSON_ARGUMENTS]
+    resource:URI
+    prompt:NAME[:JSON_ARGUMENTS]
+and are issued round-robin. Without --op, a mix for basic_mcp_server.py is used.
 """
 
+import argparse
 import asyncio
 import json
-from typing import Any
-from mcp.server import Server
-from mcp.types import (
-    Tool,
-    TextContent,
-    ImageContent,
-    EmbeddedResource,
-    Resource,
-    Prompt,
-    PromptMessage,
-    GetPromptResult,
-)
-from mcp.server.stdio import stdio_server
-
-# Initialize MCP server
-app = Server("weather-server")
-
-# Sample data for demonstration
-WEATHER_DATA = {
-    "seoul": {"temp": 18, "condition": "Cloudy", "humidity": 65},
-    "tokyo": {"temp": 22, "condition": "Sunny", "humidity": 55},
-    "london": {"temp": 12, "condition": "Rainy", "humidity": 80},
-}
-
-# 1. List available tools
-@app.list_tools()
-async def list_tools() -> list[Tool]:
-    """Return list of available tools"""
-    return [
-        Tool(
-            name="get_weather",
-            description="Get current weather information for a city",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name (e.g., seoul, tokyo, london)",
-                    }
-                },
-                "required": ["city"],
-            },
-        ),
-        Tool(
-            name="get_forecast",
-            description="Get 3-day weather forecast for a city",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "city": {
-                        "type": "string",
-                        "description": "City name",
-                    },
-                    "days": {
-                        "type": "number",
-                        "description": "Number of days (1-3)",
-                        "default": 3,
-                    }
-                },
-                "required": ["city"],
-            },
-        ),
-    ]
-
-
-# 2. Handle tool calls
-@app.call_tool()
-async def call_tool(name: str, arguments: Any) -> list[TextContent]:
-    """Execute tool based on name"""
-    
-    if name == "get_weather":
-        city = arguments.get("city", "").lower()
-        
-        if city not in WEATHER_DATA:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Weather data not available for {city}. Available cities: {', '.join(WEATHER_DATA.keys())}"
-                )
-            ]
-        
-        weather = WEATHER_DATA[city]
-        result = f"Weather in {city.title()}:\n"
-        result += f"Temperature: {weather['temp']}°C\n"
-        result += f"Condition: {weather['condition']}\n"
-        result += f"Humidity: {weather['humidity']}%"
-        
-        return [TextContent(type="text", text=result)]
-    
-    elif name == "get_forecast":
-        city = arguments.get("city", "").lower()
-        days = min(arguments.get("days", 3), 3)
-        
-        if city not in WEATHER_DATA:
-            return [
-                TextContent(
-                    type="text",
-                    text=f"Forecast data not available for {city}"
-                )
-            ]
-        
-        result = f"{days}-day forecast for {city.title()}:\n"
-        for day in range(1, days + 1):
-            result += f"Day {day}: {WEATHER_DATA[city]['condition']}, "
-            result += f"{WEATHER_DATA[city]['temp'] + day}°C\n"
-        
-        return [TextContent(type="text", text=result)]
-    
-    raise ValueError(f"Unknown tool: {name}")
-
-
-# 3. List available resources
-@app.list_resources()
-async def list_resources() -> list[Resource]:
-    """Return list of available resources"""
-    return [
-        Resource(
-            uri="weather://cities",
-            name="Available Cities",
-            mimeType="application/json",
-            description="List of cities with weather data",
-        ),
-        Resource(
-            uri=f"weather://city/seoul",
-            name="Seoul Weather",
-            mimeType="application/json",
-            description="Current weather data for Seoul",
-        ),
-    ]
-
-
-# 4. Read resource content
-@app.read_resource()
-async def read_resource(uri: str) -> str:
-    """Return resource content based on URI"""
-    
-    if uri == "weather://cities":
-        return json.dumps(list(WEATHER_DATA.keys()), indent=2)
-    
-    if uri.startswith("weather://city/"):
-        city = uri.split("/")[-1].lower()
-        if city in WEATHER_DATA:
-            return json.dumps(WEATHER_DATA[city], indent=2)
-        raise ValueError(f"City not found: {city}")
-    
-    raise ValueError(f"Unknown resource: {uri}")
-
-
-# 5. List available prompts
-@app.list_prompts()
-async def list_prompts() -> list[Prompt]:
-    """Return list of available prompt templates"""
-    return [
-        Prompt(
-            name="weather_report",
-            description="Generate a weather report for a city",
-            arguments=[
-                {
-                    "name": "city",
-                    "description": "City name",
-                    "required": True,
-                }
-            ],
-        )
-    ]
-
-
-# 6. Get prompt content
-@app.get_prompt()
-async def get_prompt(name: str, arguments: dict[str, str]) -> GetPromptResult:
-    """Return prompt content based on name and arguments"""
-    
-    if name == "weather_report":
-        city = arguments.get("city", "Seoul")
-        
-        return GetPromptResult(
-            description=f"Weather report prompt for {city}",
-            messages=[
-                PromptMessage(
-                    role="user",
-                    content=TextContent(
-                        type="text",
-                        text=f"Please provide a detailed weather report for {city}, including temperature, conditions, and any recommendations for outdoor activities."
-                    ),
-                )
-            ],
-        )
-    
-    raise ValueError(f"Unknown prompt: {name}")
-
-
-# Main entry point
-async def main():
-    """Run the MCP server"""
-    async with stdio_server() as (read_stream, write_stream):
-        await app.run(
-            read_stream,
-            write_stream,
-            app.create_initialization_options()
+import os
+import sys
+import time
+from contextlib import AsyncExitStack
+from datetime import timedelta
+from typing import Any, Optional
+
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import TextContent
+
+DEFAULT_OPERATIONS = [
+    'tool:get_weather:{"city": "seoul"}',
+    'tool:get_forecast:{"city": "tokyo", "days": 3}',
+    "resource:weather://city/seoul",
+    'prompt:weather_report:{"city": "Seoul"}',
+]
+
+
+class Operation:
+    """One kind of request, parsed from "kind:target[:json]" """
+
+    def __init__(self, spec: str):
+        kind, _, rest = spec.partition(":")
+        if kind == "resource":
+            target, arguments = rest, None
+        elif kind in ("tool", "prompt"):
+            target, _, raw = rest.partition(":")
+            arguments = json.loads(raw) if raw else {}
+        else:
+            raise ValueError(f"Unknown operation kind in {spec!r} (expected tool, resource or prompt)")
+        if not target:
+            raise ValueError(f"Missing name or URI in {spec!r}")
+        self.kind = kind
+        self.target = target
+        self.arguments = arguments
+        self.label = f"{kind}:{target}"
+
+    async def __call__(self, session: ClientSession) -> None:
+        if self.kind == "tool":
+            result = await session.call_tool(self.target, self.arguments)
+            if result.isError:
+                text = next((c.text for c in result.content if isinstance(c, TextContent)), None)
+                raise ToolError(text if text is not None else repr(result.content))
+        elif self.kind == "resource":
+            await session.read_resource(self.target)
+        else:
+            await session.get_prompt(self.target, self.arguments)
+
+
+class ToolError(Exception):
+    """The call succeeded at the protocol level but the tool reported isError"""
+
+
+class Recorder:
+    """Latencies and errors, overall and per operation"""
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = {}
+        self.errors: dict[str, int] = {}
+        self.error_types: dict[str, int] = {}
+        self.first_error: Optional[str] = None
+
+    def success(self, label: str, latency: float) -> None:
+        self.latencies.setdefault(label, []).append(latency)
+
+    def failure(self, label: str, latency: float, error: BaseException) -> None:
+        self.latencies.setdefault(label, []).append(latency)
+        self.errors[label] = self.errors.get(label, 0) + 1
+        name = type(error).__name__
+        self.error_types[name] = self.error_types.get(name, 0) + 1
+        if self.first_error is None:
+            self.first_error = f"{label}: {name}: {error}"
+
+
+def percentile(ordered: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not ordered:
+        return 0.0
+    rank = max(1, min(len(ordered), round(fraction * len(ordered) + 0.5)))
+    return ordered[rank - 1]
+
+
+def summarize(latencies: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    ordered = sorted(latencies)
+    count = len(ordered)
+    return {
+        "requests": count,
+        "errors": errors,
+        "error_rate": round(errors / count, 6) if count else 0.0,
+        "throughput_rps": round(count / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "mean": round(sum(ordered) / count * 1000, 3) if count else 0.0,
+            "p50": round(percentile(ordered, 0.50) * 1000, 3),
+            "p95": round(percentile(ordered, 0.95) * 1000, 3),
+            "p99": round(percentile(ordered, 0.99) * 1000, 3),
+            "max": round(ordered[-1] * 1000, 3) if count else 0.0,
+        },
+    }
+
+
+async def open_session(
+    stack: AsyncExitStack,
+    server: Optional[str],
+    url: Optional[str],
+    timeout: float,
+    server_log,
+) -> ClientSession:
+    if url:
+        read, write, _ = await stack.enter_async_context(streamablehttp_client(url, timeout=timeout))
+    else:
+        # Run the server from its own directory so it finds its sibling modules
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=[os.path.abspath(server)],
+            cwd=os.path.dirname(os.path.abspath(server)),
         )
+        read, write = await stack.enter_async_context(stdio_client(params, errlog=server_log))
+    session = await stack.enter_async_context(
+        ClientSession(read, write, read_timeout_seconds=timedelta(seconds=timeout))
+    )
+    await session.initialize()
+    return session
+
+
+async def run_load(
+    sessions: list[ClientSession],
+    operations: list[Operation],
+    requests: Optional[int],
+    duration: Optional[float],
+    concurrency: int,
+    rate: float,
+    recorder: Optional[Recorder],
+) -> float:
+    """
+    Issue requests from `concurrency` workers until `requests` have been sent
+    or `duration` seconds have passed, and return the elapsed time.
+
+    With rate > 0 request i is scheduled at start + i / rate, and its latency
+    is measured from that scheduled time, so a server that falls behind shows
+    up as queueing delay instead of a lower send rate.
+    """
+    start = time.perf_counter()
+    deadline = start + duration if duration else None
+    issued = 0
+
+    def next_index() -> Optional[int]:
+        nonlocal issued
+        if requests is not None and issued >= requests:
+            return None
+        index = issued
+        issued += 1
+        return index
+
+    async def worker() -> None:
+        while True:
+            index = next_index()
+            if index is None:
+                return
+            scheduled = start + index / rate if rate > 0 else time.perf_counter()
+            if deadline is not None and scheduled >= deadline:
+                return
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            elif rate <= 0:
+                scheduled = time.perf_counter()
+
+            operation = operations[index % len(operations)]
+            session = sessions[index % len(sessions)]
+            try:
+                await operation(session)
+            except Exception as e:
+                if recorder is not None:
+                    recorder.failure(operation.label, time.perf_counter() - scheduled, e)
+            else:
+                if recorder is not None:
+                    recorder.success(operation.label, time.perf_counter() - scheduled)
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start
+
+
+async def main(argv: Optional[list[str]] = None) -> dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Concurrent MCP client load generator")
+    parser.add_argument("server", nargs="?", help="server script to launch over stdio")
+    parser.add_argument("--url", help="streamable HTTP endpoint, e.g. http://127.0.0.1:8000/mcp")
+    parser.add_argument("--op", action="append", dest="operations", metavar="SPEC", help="operation (repeatable)")
+    parser.add_argument("--requests", type=int, help="total requests (default 1000 unless --duration is set)")
+    parser.add_argument("--duration", type=float, help="stop after this many seconds")
+    parser.add_argument("--concurrency", type=int, default=16, help="requests in flight")
+    parser.add_argument("--sessions", type=int, default=1, help="client sessions (stdio: server processes)")
+    parser.add_argument("--rate", type=float, default=0, help="target requests/s (0 = as fast as possible)")
+    parser.add_argument("--warmup", type=int, default=50, help="unrecorded requests before measuring")
+    parser.add_argument("--timeout", type=float, default=30, help="per-request timeout in seconds")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    parser.add_argument("--server-log", default=os.devnull, help="where stdio servers' stderr goes")
+    args = parser.parse_args(argv)
+
+    if bool(args.server) == bool(args.url):
+        parser.error("give either a server script (stdio) or --url (HTTP)")
+    if args.concurrency < 1 or args.sessions < 1:
+        parser.error("--concurrency and --sessions must be at least 1")
+    try:
+        operations = [Operation(spec) for spec in args.operations or DEFAULT_OPERATIONS]
+    except ValueError as e:
+        parser.error(str(e))
+    requests = args.requests if args.requests is not None or args.duration else 1000
+
+    with open(args.server_log, "w") as server_log:
+        async with AsyncExitStack() as stack:
+            sessions = [
+                await open_session(stack, args.server, args.url, args.timeout, server_log)
+                for _ in range(args.sessions)
+            ]
+            if args.warmup:
+                await run_load(sessions, operations, args.warmup, None, args.concurrency, 0, None)
+
+            recorder = Recorder()
+            elapsed = await run_load(
+                sessions, operations, requests, args.duration, args.concurrency, args.rate, recorder
+            )
+
+    all_latencies = [latency for latencies in recorder.latencies.values() for latency in latencies]
+    report = {
+        "target": args.url or args.server,
+        "transport": "http" if args.url else "stdio",
+        "sessions": args.sessions,
+        "concurrency": args.concurrency,
+        "target_rate_rps": args.rate or None,
+        "duration_s": round(elapsed, 3),
+        **summarize(all_latencies, sum(recorder.errors.values()), elapsed),
+        "operations": {
+            label: summarize(latencies, recorder.errors.get(label, 0), elapsed)
+            for label, latencies in recorder.latencies.items()
+        },
+        "error_types": recorder.error_types,
+        "first_error": recorder.first_error,
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return report
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
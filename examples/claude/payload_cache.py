@@ -0,0 +1,96 @@
+"""
+Payload Cache
+Resource contents serialized once per URI as compact JSON, with optional
+content hashes for client-side change detection
+"""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from mcp.types import TextResourceContents
+
+try:
+    import orjson
+except ImportError:  # optional: same output, slower
+    orjson = None
+
+
+def dumps(value: Any) -> bytes:
+    """Compact UTF-8 JSON; uses orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class Payload:
+    __slots__ = ("data", "hash", "contents")
+
+    def __init__(self, uri: str, data: bytes, mime_type: str, with_hash: bool):
+        self.data = data
+        self.hash = content_hash(data) if with_hash else None
+        # Built once and returned as-is on every read of this URI
+        self.contents = TextResourceContents(
+            uri=uri,
+            text=data.decode(),
+            mimeType=mime_type,
+            _meta={"hash": self.hash} if with_hash else None,
+        )
+
+
+class PayloadCache:
+    """
+    LRU of serialized resource payloads keyed by URI.
+
+    get() serializes build()'s result on a miss and reuses it afterwards, so
+    only cache URIs whose content depends on nothing but the data behind
+    them, and call invalidate() when that data changes. With hashes=True each
+    payload's _meta carries a blake2b hash of its bytes; clients can compare
+    it with the last one they saw to skip unchanged content.
+    """
+
+    def __init__(self, max_entries: int = 4096, hashes: bool = True, mime_type: str = "application/json"):
+        self.max_entries = max_entries
+        self.hashes = hashes
+        self.mime_type = mime_type
+        self._entries: OrderedDict[str, Payload] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, uri: str, build: Callable[[], Any]) -> Payload:
+        payload = self._entries.get(uri)
+        if payload is not None:
+            self._entries.move_to_end(uri)
+            self.hits += 1
+            return payload
+
+        self.misses += 1
+        payload = Payload(uri, dumps(build()), self.mime_type, self.hashes)
+        self._entries[uri] = payload
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return payload
+
+    def invalidate(self, uri: Optional[str] = None) -> None:
+        """Drop the payload for uri, or every payload if uri is None"""
+        if uri is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(uri, None)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": sum(len(payload.data) for payload in self._entries.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "encoder": "orjson" if orjson is not None else "json",
+        }
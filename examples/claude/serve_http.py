@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Streamable HTTP Serving
+Serve any example server (FastMCP or low-level Server) over streamable HTTP
+from several uvicorn worker processes
+
+    python serve_http.py basic_mcp_server.py --workers 4
+    python serve_http.py ../book/tutorial_4.py:mcp --port 8001 --workers 8
+
+Clients connect to http://HOST:PORT/mcp.
+"""
+
+import argparse
+import contextlib
+import importlib
+import os
+import sys
+from typing import Any, AsyncIterator
+
+import uvicorn
+from mcp.server import Server
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.server import StreamableHTTPASGIApp
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.routing import Route
+
+# uvicorn starts each worker by importing app_from_env, so the serving
+# options travel to the workers through the environment
+_ENV_TARGET = "MCP_HTTP_TARGET"
+_ENV_PATH = "MCP_HTTP_PATH"
+_ENV_STATELESS = "MCP_HTTP_STATELESS"
+_ENV_JSON_RESPONSE = "MCP_HTTP_JSON_RESPONSE"
+
+
+def load_server(target: str) -> FastMCP | Server:
+    """
+    Import "path/to/server.py[:attribute]" and return its server object.
+    Without an attribute, the first FastMCP or Server in the module is used.
+    """
+    module, attribute = _import_target(target)
+
+    if attribute:
+        server = getattr(module, attribute)
+    else:
+        server = next((value for value in vars(module).values() if isinstance(value, (FastMCP, Server))), None)
+    if not isinstance(server, (FastMCP, Server)):
+        raise ValueError(f"No FastMCP or Server instance found in {target}")
+    return server
+
+
+def single_worker_reason(target: str) -> str | None:
+    """
+    A server module that keeps state between requests in process memory
+    (jobs, caches that later requests look up by id) sets
+    HTTP_SINGLE_WORKER to a short explanation. With several workers a
+    follow-up request could reach a worker that never saw that state.
+    """
+    module, _ = _import_target(target)
+    return getattr(module, "HTTP_SINGLE_WORKER", None)
+
+
+def _import_target(target: str):
+    path, attribute = _split_target(target)
+    directory, filename = os.path.split(os.path.abspath(path))
+    # The examples import their sibling modules by plain name
+    if directory not in sys.path:
+        sys.path.insert(0, directory)
+    return importlib.import_module(os.path.splitext(filename)[0]), attribute
+
+
+def _split_target(target: str) -> tuple[str, str]:
+    path, sep, attribute = target.rpartition(":")
+    if sep and attribute.isidentifier():
+        return path, attribute
+    return target, ""
+
+
+def process_lifespan(server: Server):
+    """
+    Run the server's lifespan once per worker process.
+
+    Server.run() enters the lifespan for every HTTP session, or for every
+    request in stateless mode, so pools and clients set up there would be
+    created and shut down per request. Enter it once at startup instead, and
+    give each session the shared context.
+    """
+    @contextlib.asynccontextmanager
+    async def lifespan(_app: Starlette) -> AsyncIterator[None]:
+        original = server.lifespan
+        async with original(server) as context:
+            server.lifespan = lambda _server: contextlib.nullcontext(context)
+            try:
+                yield
+            finally:
+                server.lifespan = original
+    return lifespan
+
+
+def create_app(
+    server: FastMCP | Server,
+    path: str = "/mcp",
+    stateless: bool = True,
+    json_response: bool = False,
+) -> Starlette:
+    """Streamable HTTP ASGI app for a FastMCP or low-level Server"""
+    if isinstance(server, FastMCP):
+        server.settings.streamable_http_path = path
+        server.settings.stateless_http = stateless
+        server.settings.json_response = json_response
+        app = server.streamable_http_app()
+        lowlevel = server._mcp_server
+        session_lifespan = app.router.lifespan_context
+    else:
+        lowlevel = server
+        manager = StreamableHTTPSessionManager(app=server, json_response=json_response, stateless=stateless)
+        app = Starlette(routes=[Route(path, endpoint=StreamableHTTPASGIApp(manager))])
+        session_lifespan = lambda _app: manager.run()
+
+    server_lifespan = process_lifespan(lowlevel)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        # On shutdown the session manager stops first (cancelling requests
+        # still running after uvicorn's graceful timeout), then the server's
+        # own resources are released
+        async with server_lifespan(app), session_lifespan(app):
+            yield
+
+    app.router.lifespan_context = lifespan
+    return app
+
+
+def app_from_env() -> Starlette:
+    """uvicorn factory: builds the app in each worker process"""
+    return create_app(
+        load_server(os.environ[_ENV_TARGET]),
+        path=os.environ.get(_ENV_PATH, "/mcp"),
+        stateless=os.environ.get(_ENV_STATELESS, "1") == "1",
+        json_response=os.environ.get(_ENV_JSON_RESPONSE, "0") == "1",
+    )
+
+
+def serve(
+    target: str,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 1,
+    path: str = "/mcp",
+    stateless: bool = True,
+    json_response: bool = False,
+    graceful_timeout: float = 30,
+    log_level: str = "info",
+    **uvicorn_options: Any,
+) -> None:
+    """
+    Serve target with uvicorn. Workers share one listening socket, and
+    connections are spread across them by the kernel, so a client's requests
+    can land on any worker: stateful sessions (which live in the memory of
+    the worker that created them) need a single worker, and so do servers
+    that declare HTTP_SINGLE_WORKER.
+
+    On SIGINT/SIGTERM each worker stops accepting connections, lets
+    in-flight requests finish for up to graceful_timeout seconds, then runs
+    the server's lifespan shutdown.
+    """
+    if workers > 1 and not stateless:
+        raise ValueError(
+            "Stateful sessions are kept in one worker's memory; use stateless mode with several workers, "
+            "or run single-worker instances behind a load balancer that routes on the Mcp-Session-Id header"
+        )
+    # Fail here, not in every worker, if the target cannot be loaded
+    load_server(target)
+    reason = single_worker_reason(target)
+    if workers > 1 and reason:
+        raise ValueError(f"{target} must be served by a single worker: {reason}")
+
+    script, attribute = _split_target(target)
+    os.environ[_ENV_TARGET] = os.path.abspath(script) + (f":{attribute}" if attribute else "")
+    os.environ[_ENV_PATH] = path
+    os.environ[_ENV_STATELESS] = "1" if stateless else "0"
+    os.environ[_ENV_JSON_RESPONSE] = "1" if json_response else "0"
+    uvicorn.run(
+        "serve_http:app_from_env",
+        factory=True,
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host=host,
+        port=port,
+        workers=workers,
+        timeout_graceful_shutdown=graceful_timeout,
+        log_level=log_level,
+        **uvicorn_options,
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Serve an MCP server over streamable HTTP")
+    parser.add_argument("target", help="path/to/server.py[:attribute]")
+    parser.add_argument("--host", default=os.environ.get("MCP_HTTP_HOST", "127.0.0.1"))
+    parser.add_argument("--port", type=int, default=int(os.environ.get("MCP_HTTP_PORT", "8000")))
+    parser.add_argument(
+        "--workers", type=int, default=int(os.environ.get("MCP_HTTP_WORKERS", "1")),
+        help="worker processes (0 = one per CPU core)",
+    )
+    parser.add_argument("--path", default="/mcp")
+    parser.add_argument("--stateful", action="store_true", help="keep sessions between requests (single worker only)")
+    parser.add_argument("--json-response", action="store_true", help="answer with JSON instead of an SSE stream")
+    parser.add_argument("--graceful-timeout", type=float, default=30, help="seconds to let in-flight requests finish")
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args(argv)
+
+    try:
+        serve(
+            args.target,
+            host=args.host,
+            port=args.port,
+            workers=args.workers or os.cpu_count() or 1,
+            path=args.path,
+            stateless=not args.stateful,
+            json_response=args.json_response,
+            graceful_timeout=args.graceful_timeout,
+            log_level=args.log_level,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    main()
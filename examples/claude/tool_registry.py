@@ -0,0 +1,108 @@
+"""
+Tool Registry
+Maps tool names to handlers and validates arguments with JSON Schema
+validators compiled once at registration
+"""
+
+import inspect
+import json
+from typing import Any, Awaitable, Callable
+
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+from mcp.types import TextContent, Tool
+
+from catalog import Catalog
+
+# Unstructured content, or (content, structuredContent)
+ToolResult = list[TextContent] | tuple[list[TextContent], dict[str, Any]]
+ToolHandler = Callable[..., Awaitable[ToolResult]]
+
+
+class _RegisteredTool:
+    __slots__ = ("tool", "handler", "validator", "is_async", "parameters")
+
+    def __init__(self, tool: Tool, handler: ToolHandler, validator: Any):
+        self.tool = tool
+        self.handler = handler
+        self.validator = validator
+        self.is_async = inspect.iscoroutinefunction(handler)
+        # Keys the handler is called with: the schema's declared properties,
+        # or everything if the handler takes **kwargs
+        accepts_any = any(
+            p.kind is inspect.Parameter.VAR_KEYWORD for p in inspect.signature(handler).parameters.values()
+        )
+        self.parameters = None if accepts_any else frozenset(tool.inputSchema.get("properties", ()))
+
+
+class ToolRegistry:
+    """
+    Register tools with a decorator and dispatch calls by name.
+
+    Each handler receives the validated arguments as keyword arguments, so
+    optional schema properties should have Python defaults. Arguments the
+    schema does not declare are dropped instead of reaching the handler. Because arguments
+    are validated here, register the server's call_tool handler with
+    validate_input=False to skip the per-call jsonschema.validate() done by
+    the low-level Server.
+    """
+
+    def __init__(self):
+        self._tools: dict[str, _RegisteredTool] = {}
+        self.catalog: Catalog[Tool] = Catalog()
+        # Tools that declare the same schema share one compiled validator
+        self._validators: dict[str, Any] = {}
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def tool(self, name: str, description: str, input_schema: dict[str, Any]) -> Callable:
+        def decorator(handler: ToolHandler) -> ToolHandler:
+            self.add(Tool(name=name, description=description, inputSchema=input_schema), handler)
+            return handler
+        return decorator
+
+    def add(self, tool: Tool, handler: ToolHandler) -> None:
+        if tool.name in self._tools:
+            raise ValueError(f"Duplicate tool: {tool.name}")
+        self._tools[tool.name] = _RegisteredTool(tool, handler, self._compile(tool.inputSchema))
+        self.catalog.add(tool.name, tool)
+
+    def remove(self, name: str) -> None:
+        if self._tools.pop(name, None) is not None:
+            self.catalog.remove(name)
+
+    def _compile(self, schema: dict[str, Any]) -> Any:
+        key = json.dumps(schema, sort_keys=True)
+        validator = self._validators.get(key)
+        if validator is None:
+            schema_validator = validator_for(schema)
+            # Fail at startup, not on the first call, if the declared schema is invalid
+            schema_validator.check_schema(schema)
+            validator = self._validators[key] = schema_validator(schema)
+        return validator
+
+    def list_tools(self) -> list[Tool]:
+        """The cached tool listing; rebuilt only after add() or remove()"""
+        return self.catalog.list()
+
+    async def call(self, name: str, arguments: dict[str, Any] | None) -> ToolResult:
+        entry = self._tools.get(name)
+        if entry is None:
+            raise ValueError(f"Unknown tool: {name}")
+
+        arguments = arguments or {}
+        if not entry.validator.is_valid(arguments):
+            # Only build the (slower) error report when validation fails
+            error = best_match(entry.validator.iter_errors(arguments))
+            raise ValueError(f"Input validation error: {error.message}")
+
+        if entry.parameters is not None and not entry.parameters.issuperset(arguments):
+            arguments = {key: value for key, value in arguments.items() if key in entry.parameters}
+        result = entry.handler(**arguments)
+        if entry.is_async:
+            result = await result
+        return result
@@ -0,0 +1,100 @@
+"""
+URI Template Router
+Matches resource URIs against many URI templates with a segment tree
+"""
+
+from typing import Any, Callable, Optional
+
+
+class _Node:
+    __slots__ = ("literal", "param", "route")
+
+    def __init__(self):
+        self.literal: dict[str, _Node] = {}
+        self.param: Optional[_Node] = None
+        # (template, handler, parameter names) when a template ends at this node
+        self.route: Optional[tuple[str, Callable[..., Any], tuple[str, ...]]] = None
+
+
+class URIRouter:
+    """
+    Route URIs such as "weather://city/seoul" to handlers registered with
+    templates such as "weather://city/{city}".
+
+    Templates are split on "/" into a tree of segments. A segment is either a
+    literal or a single "{name}" parameter that matches one non-empty segment
+    (the same rule FastMCP uses). Lookup walks the tree once per URI segment, so
+    its cost depends on the URI length, not on how many templates are registered.
+    When both a literal and a parameter could match, the literal wins.
+    """
+
+    def __init__(self):
+        self._root = _Node()
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, template: str, handler: Callable[..., Any]) -> None:
+        node = self._root
+        names = []
+        for segment in template.split("/"):
+            if segment.startswith("{") and segment.endswith("}") and len(segment) > 2:
+                names.append(segment[1:-1])
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            elif "{" in segment or "}" in segment:
+                raise ValueError(f"Parameters must span a whole path segment: {template}")
+            else:
+                node = node.literal.setdefault(segment, _Node())
+        if node.route is not None:
+            raise ValueError(f"Duplicate URI template: {template} (already registered as {node.route[0]})")
+        node.route = (template, handler, tuple(names))
+        self._count += 1
+
+    def route(self, template: str) -> Callable:
+        """Decorator form of add()"""
+        def decorator(handler: Callable[..., Any]) -> Callable[..., Any]:
+            self.add(template, handler)
+            return handler
+        return decorator
+
+    def match(self, uri: str) -> Optional[tuple[Callable[..., Any], dict[str, str]]]:
+        """Return (handler, parameters) for the URI, or None if no template matches"""
+        segments = uri.split("/")
+        found = self._walk(self._root, segments, 0, [])
+        if found is None:
+            return None
+        (_, handler, names), values = found
+        return handler, dict(zip(names, values))
+
+    def _walk(self, node: _Node, segments: list[str], index: int, values: list[str]):
+        if index == len(segments):
+            return (node.route, values) if node.route is not None else None
+
+        segment = segments[index]
+        child = node.literal.get(segment)
+        if child is not None:
+            found = self._walk(child, segments, index + 1, values)
+            if found is not None:
+                return found
+        if node.param is not None and segment:
+            values.append(segment)
+            found = self._walk(node.param, segments, index + 1, values)
+            if found is not None:
+                return found
+            values.pop()
+        return None
+
+    def templates(self) -> list[str]:
+        result = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node.route is not None:
+                result.append(node.route[0])
+            stack.extend(node.literal.values())
+            if node.param is not None:
+                stack.append(node.param)
+        return sorted(result)
@@ -0,0 +1,161 @@
+"""
+Weather Store
+Columnar station data backed by NumPy arrays, with memory-mapped loading
+and vectorized multi-day forecasts
+"""
+
+import csv
+import json
+import os
+from typing import Any, Iterable, Optional
+
+import numpy as np
+
+# Column files written by save() and read by load()
+_COLUMNS = ("temp", "humidity", "condition")
+
+
+class WeatherStore:
+    """
+    One row per station. temp, humidity and condition (an index into
+    conditions) are parallel arrays; index maps a lower-cased city name to
+    its row.
+
+    Loading from a directory saved with save() memory-maps the arrays, so
+    opening a store with 100k+ stations does not read them into memory and
+    several server processes share the same pages.
+    """
+
+    def __init__(
+        self,
+        names: list[str],
+        temp: np.ndarray,
+        humidity: np.ndarray,
+        condition: np.ndarray,
+        conditions: list[str],
+    ):
+        if not (len(names) == len(temp) == len(humidity) == len(condition)):
+            raise ValueError("All columns must have one value per station")
+        self.names = names
+        # Plain ndarray views of memmaps: same pages, cheaper per-row indexing
+        self.temp = np.asarray(temp)
+        self.humidity = np.asarray(humidity)
+        self.condition = np.asarray(condition)
+        self.conditions = conditions
+        self.index = {name.lower(): row for row, name in enumerate(names)}
+        if len(self.index) != len(names):
+            raise ValueError("City names must be unique (case-insensitive)")
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, city: str) -> bool:
+        return city.lower() in self.index
+
+    # Building and loading
+
+    @classmethod
+    def from_records(cls, records: dict[str, dict[str, Any]]) -> "WeatherStore":
+        """Build from {"seoul": {"temp": 18, "condition": "Cloudy", "humidity": 65}, ...}"""
+        return cls._from_rows(
+            (name, row["temp"], row["humidity"], row["condition"]) for name, row in records.items()
+        )
+
+    @classmethod
+    def from_csv(cls, path: str) -> "WeatherStore":
+        """Build from a CSV file with city,temp,humidity,condition columns"""
+        with open(path, newline="", encoding="utf-8") as f:
+            return cls._from_rows(
+                (row["city"], float(row["temp"]), float(row["humidity"]), row["condition"])
+                for row in csv.DictReader(f)
+            )
+
+    @classmethod
+    def _from_rows(cls, rows: Iterable[tuple[str, float, float, str]]) -> "WeatherStore":
+        names, temps, humidities, codes = [], [], [], []
+        conditions: dict[str, int] = {}
+        for name, temp, humidity, condition in rows:
+            names.append(name)
+            temps.append(temp)
+            humidities.append(humidity)
+            codes.append(conditions.setdefault(condition, len(conditions)))
+        return cls(
+            names,
+            # float64 so that a CSV value like 18.3 reads back as 18.3
+            np.asarray(temps, dtype=np.float64),
+            np.asarray(humidities, dtype=np.float64),
+            np.asarray(codes, dtype=np.uint16),
+            list(conditions),
+        )
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "WeatherStore":
+        """Open a store written by save(); arrays are memory-mapped unless mmap=False"""
+        with open(os.path.join(directory, "meta.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        mmap_mode = "r" if mmap else None
+        columns = {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode=mmap_mode) for name in _COLUMNS}
+        return cls(meta["names"], columns["temp"], columns["humidity"], columns["condition"], meta["conditions"])
+
+    @classmethod
+    def open(cls, path: str) -> "WeatherStore":
+        """Load a saved store directory, or build from a .csv file"""
+        if os.path.isdir(path):
+            return cls.load(path)
+        return cls.from_csv(path)
+
+    def save(self, directory: str) -> None:
+        os.makedirs(directory, exist_ok=True)
+        for name in _COLUMNS:
+            np.save(os.path.join(directory, f"{name}.npy"), np.ascontiguousarray(getattr(self, name)))
+        with open(os.path.join(directory, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"names": self.names, "conditions": self.conditions}, f, ensure_ascii=False)
+
+    # Queries
+
+    def row(self, city: str) -> Optional[int]:
+        return self.index.get(city.lower())
+
+    def rows(self, cities: Iterable[str]) -> np.ndarray:
+        """Row numbers for cities; -1 for unknown cities"""
+        index = self.index
+        return np.fromiter((index.get(city.lower(), -1) for city in cities), dtype=np.int64)
+
+    def lookup(self, city: str) -> Optional[dict[str, Any]]:
+        row = self.row(city)
+        if row is None:
+            return None
+        return self.record(row)
+
+    def record(self, row: int) -> dict[str, Any]:
+        return {
+            "temp": _number(self.temp.item(row)),
+            "condition": self.conditions[self.condition.item(row)],
+            "humidity": _number(self.humidity.item(row)),
+        }
+
+    def records(self, rows: np.ndarray) -> list[dict[str, Any]]:
+        """record() for many rows, gathering each column once"""
+        conditions = self.conditions
+        return [
+            {"temp": _number(temp), "condition": conditions[code], "humidity": _number(humidity)}
+            for temp, humidity, code in zip(
+                self.temp[rows].tolist(), self.humidity[rows].tolist(), self.condition[rows].tolist()
+            )
+        ]
+
+    def forecast(self, rows: np.ndarray, days: int) -> np.ndarray:
+        """
+        Forecast temperatures for many stations at once: a (len(rows), days)
+        array where day d (1-based) is the current temperature + d.
+        """
+        return self.temp[rows][:, None] + np.arange(1, days + 1, dtype=self.temp.dtype)
+
+    def forecast_lists(self, rows: np.ndarray, days: int) -> list[list[float | int]]:
+        """forecast() as JSON-ready lists"""
+        return [[_number(temp) for temp in temps] for temps in self.forecast(rows, days).tolist()]
+
+
+def _number(value: float) -> float | int:
+    """Integral values print as 18, not 18.0"""
+    return int(value) if value.is_integer() else value